@@ -1,38 +1,50 @@
 import numpy as np
-import pandas as pd
+
+from cashflows import CashflowBook
+from curve import YieldCurve
 
 FV_A=np.array([225,215,250,225,205])
 FV_B=np.array([220,225,250,250,210])
 t=np.array([1,2,3,4,5])
 r=4.33/100
 
-def PV(FV,t):
-    df=np.exp(-r*t);
-    pv=np.zeros_like(FV)
-    for i in range(len(FV)):
-        pv[i]=FV[i]*df[i]
-    return df,pv
-
-df_A,PV_A=PV(FV_A,t)
-df_B,PV_B=PV(FV_B,t)
-
-data={
-    'Time (yrs)':t,
-    'Discount Factor':df_A,
-    'Future Cashflow (A)':FV_A,
-    'Future Cashflow (B)':FV_B,
-    'Present Value (A)':PV_A,
-    'Present Value (B)':PV_B
-}
-df=pd.DataFrame(data)
-print(df)
-
-print(f"The present value of the investment A is :",PV_A.sum())
-print(f"The present value of the investment B is :",PV_B.sum())
-
-if PV_A.sum()<PV_B.sum():    
-    print(f"The investment B is better than A")
-elif PV_B.sum()<PV_A.sum():
-    print(f"The investment A is better than B")
-else:
-    print(f"The investment A is as benificial as B")
+
+def present_values(FV_A=FV_A, FV_B=FV_B, t=t, r=r):
+    """PVs of investments A and B; both go in one cashflow book (one discount pass, float PVs)"""
+    curve=YieldCurve.flat(r)
+    book=CashflowBook(np.repeat(['A','B'],len(t)),np.tile(t,2),np.concatenate([FV_A,FV_B]),curve)
+    n=len(t)
+    return {'t':t,'FV_A':FV_A,'FV_B':FV_B,'df_A':book.df[:n],
+            'PV_A':book.cashflow_pv[:n],'PV_B':book.cashflow_pv[n:],
+            'total_A':book.pv('A'),'total_B':book.pv('B')}
+
+
+def report(res):
+    """Print the cashflow table and which investment is better"""
+    import pandas as pd
+
+    data={
+        'Time (yrs)':res['t'],
+        'Discount Factor':res['df_A'],
+        'Future Cashflow (A)':res['FV_A'],
+        'Future Cashflow (B)':res['FV_B'],
+        'Present Value (A)':res['PV_A'],
+        'Present Value (B)':res['PV_B']
+    }
+    df=pd.DataFrame(data)
+    print(df)
+
+    total_A,total_B=res['total_A'],res['total_B']
+    print(f"The present value of the investment A is :",total_A)
+    print(f"The present value of the investment B is :",total_B)
+
+    if total_A<total_B:    
+        print(f"The investment B is better than A")
+    elif total_B<total_A:
+        print(f"The investment A is better than B")
+    else:
+        print(f"The investment A is as benificial as B")
+
+
+if __name__ == "__main__":
+    report(present_values())
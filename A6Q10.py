@@ -1,46 +1,41 @@
 import numpy as np
-import math
+
+from binomial import crr_parameters, exercise_boundary, lattice_nodes
 
 # Parameters
 F0, K, r, sigma, T, n = 60, 60, 0.08, 0.30, 0.5, 2
 
-# Binomial parameters
-dt = T / n
-u = math.exp(sigma * math.sqrt(dt))
-d = 1 / u
-p = (1 - d) / (u - d)
-discount = math.exp(-r * dt)
-
-print(f"Binomial Tree: u={u:.4f}, d={d:.4f}, p={p:.4f}")
-
-# Build futures price tree
-F = {}
-for i in range(n + 1):
-    for j in range(i + 1):
-        F[(i,j)] = F0 * (u**(i-j)) * (d**j)
-
-# Option values at maturity
-C = {}
-for j in range(n + 1):
-    C[(n,j)] = max(0, F[(n,j)] - K)
-
-print(f"\nFutures prices at maturity: {[F[(n,j)] for j in range(n+1)]}")
-print(f"Option payoffs at maturity: {[C[(n,j)] for j in range(n+1)]}")
-
-# Backward induction
-for i in range(n-1, -1, -1):
-    for j in range(i + 1):
-        C[(i,j)] = discount * (p * C[(i+1,j)] + (1-p) * C[(i+1,j+1)])
-
-# Check early exercise optimality
-early_exercise_optimal = False
-for i in range(n):
-    for j in range(i + 1):
-        exercise_value = max(0, F[(i,j)] - K)
-        if exercise_value > C[(i,j)]:
-            early_exercise_optimal = True
-            break
-
-print(f"\nEuropean Call Value: ${C[(0,0)]:.4f}")
-print(f"American Call Value: ${C[(0,0)]:.4f}")
-print(f"Early exercise optimal: {early_exercise_optimal}")
+
+def futures_call(F0=F0, K=K, r=r, sigma=sigma, T=T, n=n):
+    """European and American call on a futures price, and the American exercise boundary"""
+    # Binomial parameters (futures: p = (1-d)/(u-d))
+    u, d, p, discount = crr_parameters(r, sigma, T, n, futures=True)
+
+    # Futures price tree and European option values
+    F, C = lattice_nodes(F0, K, r, sigma, T, n, option='call', american=False, futures=True)
+
+    # The American induction also records the critical futures price per step
+    american_value, tau, F_star = exercise_boundary(F0, K, r, sigma, T, n, option='call', futures=True)
+    return {'n': n, 'u': u, 'd': d, 'p': p, 'F': F, 'C': C, 'european_value': C[0][0],
+            'american_value': american_value, 'tau': tau, 'F_star': F_star,
+            'early_exercise_optimal': bool(np.any(~np.isnan(F_star)))}
+
+
+def report(res):
+    """Print the tree parameters, values and where early exercise pays"""
+    n = res['n']
+    print(f"Binomial Tree: u={res['u']:.4f}, d={res['d']:.4f}, p={res['p']:.4f}")
+
+    print(f"\nFutures prices at maturity: {res['F'][n].tolist()}")
+    print(f"Option payoffs at maturity: {res['C'][n].tolist()}")
+
+    print(f"\nEuropean Call Value: ${res['european_value']:.4f}")
+    print(f"American Call Value: ${res['american_value']:.4f}")
+    print(f"Early exercise optimal: {res['early_exercise_optimal']}")
+    for t_left, f in zip(res['tau'], res['F_star']):
+        if not np.isnan(f):
+            print(f"  exercise when F >= {f:.4f} with {t_left:.4f} years left")
+
+
+if __name__ == "__main__":
+    report(futures_call())
@@ -1,19 +1,34 @@
 import numpy as np
-import pandas as pd
+
+from curve import YieldCurve
+
 r=4.5/100
 n=4
 t=np.array([1,2,3,4,5,6])
 FV=np.array([460,235,640,370,330,250])
-df=(1+(r/n))**(-n*t)
-PV=np.zeros_like(FV)
-PV=df*FV
-
-data={
-    'time(years)':t,
-    'Discount Factor':df,
-    'Cashflows ':FV,
-    'Present value of the Cashflows':PV
-}
-df=pd.DataFrame(data)
-print(df)
-print(f'The present value of the investment : {PV.sum():0.4f}')
+
+
+def present_value(r=r, n=n, t=t, FV=FV):
+    """Discount factors and PVs of the cashflows FV at times t, rate r compounded n times a year"""
+    df=YieldCurve.flat(r,compounding=n).df(t)
+    PV=df*FV
+    return {'t':t,'FV':FV,'df':df,'PV':PV,'total':PV.sum()}
+
+
+def report(res):
+    """Print the cashflow table and the total PV"""
+    import pandas as pd
+
+    data={
+        'time(years)':res['t'],
+        'Discount Factor':res['df'],
+        'Cashflows ':res['FV'],
+        'Present value of the Cashflows':res['PV']
+    }
+    df=pd.DataFrame(data)
+    print(df)
+    print(f'The present value of the investment : {res["total"]:0.4f}')
+
+
+if __name__ == "__main__":
+    report(present_value())
@@ -1,65 +1,91 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from strategy import StrategyBook
 
 # Parameters
 K = 150  # Strike price
 premium = 5  # Option premium
 S = np.arange(100, 200, 1)  # Stock price range
 
-# Profit functions
-def long_call_profit(S, K, premium):
-    return np.maximum(S - K, 0) - premium
-
-def short_call_profit(S, K, premium):
-    return -np.maximum(S - K, 0) + premium
-
-def long_put_profit(S, K, premium):
-    return np.maximum(K - S, 0) - premium
-
-def short_put_profit(S, K, premium):
-    return -np.maximum(K - S, 0) + premium
-
-# Calculate profits
-long_call = long_call_profit(S, K, premium)
-short_call = short_call_profit(S, K, premium)
-long_put = long_put_profit(S, K, premium)
-short_put = short_put_profit(S, K, premium)
-
-# Create plots
-fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-fig.suptitle(f'Options Profit Diagrams (K=${K}, Premium=${premium})', fontweight='bold')
-
-# Plot each option
-plots = [
-    (ax1, long_call, 'Long Call', 'blue'),
-    (ax2, short_call, 'Short Call', 'red'),
-    (ax3, long_put, 'Long Put', 'green'),
-    (ax4, short_put, 'Short Put', 'purple')
-]
-
-for ax, profit, title, color in plots:
-    ax.plot(S, profit, color=color, linewidth=2)
-    ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    ax.axvline(x=K, color='gray', linestyle='--', alpha=0.5)
-    ax.set_title(title)
-    ax.set_xlabel('Stock Price ($)')
-    ax.set_ylabel('Profit ($)')
-    ax.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show()
-
-# Summary
-print("Options Analysis Summary:")
-print(f"Strike Price: ${K}, Premium: ${premium}")
-print("\nBreakeven Points:")
-print(f"Long Call:  ${K + premium}")
-print(f"Short Call: ${K + premium}")
-print(f"Long Put:   ${K - premium}")
-print(f"Short Put:  ${K - premium}")
-
-print(f"\nMax Profit/Loss:")
-print(f"Long Call:  Max Loss = ${premium}, Max Profit = Unlimited")
-print(f"Short Call: Max Profit = ${premium}, Max Loss = Unlimited")
-print(f"Long Put:   Max Loss = ${premium}, Max Profit = ${K - premium}")
-print(f"Short Put:  Max Profit = ${premium}, Max Loss = ${K - premium}")
+
+def option_profits(K=K, premium=premium, S=S):
+    """Profit over S of a long/short call and put with strike K, and their breakevens and max profit/loss"""
+    # Single-leg strategies: (option, strike, expiry, quantity, premium)
+    book = StrategyBook({
+        'Long Call': [('call', K, 1, 1, premium)],
+        'Short Call': [('call', K, 1, -1, premium)],
+        'Long Put': [('put', K, 1, 1, premium)],
+        'Short Put': [('put', K, 1, -1, premium)]
+    })
+    return {'K': K, 'premium': premium, 'S': S, 'names': book.names,
+            'profits': book.profit(S), 'analysis': book.analyze()}
+
+
+def plot(res, path=None):
+    """Profit diagram of each position, saved to path if given"""
+    from rendering import new_figure
+
+    S, K = res['S'], res['K']
+    long_call, short_call, long_put, short_put = res['profits']
+
+    # Create plots
+    if path is None:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(12, 8))
+    else:
+        fig = new_figure(figsize=(12, 8))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+    fig.suptitle(f'Options Profit Diagrams (K=${K}, Premium=${res["premium"]})', fontweight='bold')
+
+    # Plot each option
+    plots = [
+        (ax1, long_call, 'Long Call', 'blue'),
+        (ax2, short_call, 'Short Call', 'red'),
+        (ax3, long_put, 'Long Put', 'green'),
+        (ax4, short_put, 'Short Put', 'purple')
+    ]
+
+    for ax, profit, title, color in plots:
+        ax.plot(S, profit, color=color, linewidth=2)
+        ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+        ax.axvline(x=K, color='gray', linestyle='--', alpha=0.5)
+        ax.set_title(title)
+        ax.set_xlabel('Stock Price ($)')
+        ax.set_ylabel('Profit ($)')
+        ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    if path is None:
+        plt.show()
+    else:
+        fig.savefig(path)
+
+
+def fmt(v):
+    return f"${v:g}" if np.isfinite(v) else "Unlimited"
+
+
+def report(res):
+    """Print breakevens and max profit/loss of each position"""
+    print("Options Analysis Summary:")
+    print(f"Strike Price: ${res['K']}, Premium: ${res['premium']}")
+    analysis = res['analysis']
+
+    print("\nBreakeven Points:")
+    for name, be in zip(res['names'], analysis['breakevens']):
+        print(f"{name + ':':<11} ${be[0]:g}")
+
+    print(f"\nMax Profit/Loss:")
+    for name, profit, loss in zip(res['names'], analysis['max_profit'], analysis['max_loss']):
+        if name.startswith('Long'):
+            print(f"{name + ':':<11} Max Loss = {fmt(loss)}, Max Profit = {fmt(profit)}")
+        else:
+            print(f"{name + ':':<11} Max Profit = {fmt(profit)}, Max Loss = {fmt(loss)}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    res = option_profits()
+    plot(res, sys.argv[1] if len(sys.argv) > 1 else None)
+    report(res)
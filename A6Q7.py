@@ -30,65 +30,72 @@ def european_put_call_parity(call_price, strike, stock_price, risk_free_rate, ti
     
     return put_price, pv_strike
 
-# Calculate the put option price
-put_price, pv_strike = european_put_call_parity(C, K, S, r, T)
 
-# Display detailed calculation
-print("=" * 60)
-print("EUROPEAN PUT OPTION PRICING")
-print("=" * 60)
-print(f"Given Information:")
-print(f"  Current Stock Price (S): ${S}")
-print(f"  Strike Price (K): ${K}")
-print(f"  Call Option Price (C): ${C}")
-print(f"  Risk-free Rate (r): {r*100}% per annum")
-print(f"  Time to Maturity (T): {T:.4f} years ({T*12:.0f} months)")
+def report(S=S, K=K, C=C, r=r, T=T):
+    """Print the worked put-call parity solution"""
+    # Calculate the put option price
+    put_price, pv_strike = european_put_call_parity(C, K, S, r, T)
 
-print("\n" + "-" * 60)
-print("PUT-CALL PARITY CALCULATION:")
-print("-" * 60)
-print(f"Formula: C + K×e^(-r×T) = P + S")
-print(f"Solving for P: P = C + K×e^(-r×T) - S")
+    # Display detailed calculation
+    print("=" * 60)
+    print("EUROPEAN PUT OPTION PRICING")
+    print("=" * 60)
+    print(f"Given Information:")
+    print(f"  Current Stock Price (S): ${S}")
+    print(f"  Strike Price (K): ${K}")
+    print(f"  Call Option Price (C): ${C}")
+    print(f"  Risk-free Rate (r): {r*100}% per annum")
+    print(f"  Time to Maturity (T): {T:.4f} years ({T*12:.0f} months)")
 
-print(f"\nStep-by-step calculation:")
-print(f"1. Present Value of Strike Price:")
-print(f"   K×e^(-r×T) = ${K} × e^(-{r} × {T:.4f})")
-print(f"   K×e^(-r×T) = ${K} × e^(-{r*T:.4f})")
-print(f"   K×e^(-r×T) = ${K} × {math.exp(-r*T):.6f}")
-print(f"   K×e^(-r×T) = ${pv_strike:.4f}")
+    print("\n" + "-" * 60)
+    print("PUT-CALL PARITY CALCULATION:")
+    print("-" * 60)
+    print(f"Formula: C + K×e^(-r×T) = P + S")
+    print(f"Solving for P: P = C + K×e^(-r×T) - S")
 
-print(f"\n2. Put Option Price:")
-print(f"   P = C + K×e^(-r×T) - S")
-print(f"   P = ${C} + ${pv_strike:.4f} - ${S}")
-print(f"   P = ${put_price:.4f}")
+    print(f"\nStep-by-step calculation:")
+    print(f"1. Present Value of Strike Price:")
+    print(f"   K×e^(-r×T) = ${K} × e^(-{r} × {T:.4f})")
+    print(f"   K×e^(-r×T) = ${K} × e^(-{r*T:.4f})")
+    print(f"   K×e^(-r×T) = ${K} × {math.exp(-r*T):.6f}")
+    print(f"   K×e^(-r×T) = ${pv_strike:.4f}")
 
-print("\n" + "=" * 60)
-print("RESULT:")
-print("=" * 60)
-print(f"**The 4-month European put option price is ${put_price:.2f}**")
+    print(f"\n2. Put Option Price:")
+    print(f"   P = C + K×e^(-r×T) - S")
+    print(f"   P = ${C} + ${pv_strike:.4f} - ${S}")
+    print(f"   P = ${put_price:.4f}")
 
-# Verification - check put-call parity holds
-print(f"\nVerification (Put-Call Parity Check):")
-left_side = C + pv_strike
-right_side = put_price + S
-print(f"Left side (C + K×e^(-r×T)): ${left_side:.4f}")
-print(f"Right side (P + S): ${right_side:.4f}")
-print(f"Difference: ${abs(left_side - right_side):.6f}")
+    print("\n" + "=" * 60)
+    print("RESULT:")
+    print("=" * 60)
+    print(f"**The 4-month European put option price is ${put_price:.2f}**")
 
-# Additional analysis
-print(f"\n" + "-" * 60)
-print("ANALYSIS:")
-print("-" * 60)
-print(f"• The put option is **in-the-money** (S < K: ${S} < ${K})")
-print(f"• Intrinsic value of put: max(K-S, 0) = max(${K}-${S}, 0) = ${max(K-S, 0)}")
-print(f"• Time value of put: ${put_price:.4f} - ${max(K-S, 0)} = ${put_price - max(K-S, 0):.4f}")
-print(f"• The put is priced above intrinsic value due to time value")
+    # Verification - check put-call parity holds
+    print(f"\nVerification (Put-Call Parity Check):")
+    left_side = C + pv_strike
+    right_side = put_price + S
+    print(f"Left side (C + K×e^(-r×T)): ${left_side:.4f}")
+    print(f"Right side (P + S): ${right_side:.4f}")
+    print(f"Difference: ${abs(left_side - right_side):.6f}")
 
-# Compare with intrinsic values
-call_intrinsic = max(S - K, 0)
-put_intrinsic = max(K - S, 0)
-print(f"\nIntrinsic Values:")
-print(f"• Call intrinsic value: max(S-K, 0) = ${call_intrinsic}")
-print(f"• Put intrinsic value: max(K-S, 0) = ${put_intrinsic}")
-print(f"• Call time value: ${C} - ${call_intrinsic} = ${C - call_intrinsic}")
-print(f"• Put time value: ${put_price:.4f} - ${put_intrinsic} = ${put_price - put_intrinsic:.4f}")
+    # Additional analysis
+    print(f"\n" + "-" * 60)
+    print("ANALYSIS:")
+    print("-" * 60)
+    print(f"• The put option is **in-the-money** (S < K: ${S} < ${K})")
+    print(f"• Intrinsic value of put: max(K-S, 0) = max(${K}-${S}, 0) = ${max(K-S, 0)}")
+    print(f"• Time value of put: ${put_price:.4f} - ${max(K-S, 0)} = ${put_price - max(K-S, 0):.4f}")
+    print(f"• The put is priced above intrinsic value due to time value")
+
+    # Compare with intrinsic values
+    call_intrinsic = max(S - K, 0)
+    put_intrinsic = max(K - S, 0)
+    print(f"\nIntrinsic Values:")
+    print(f"• Call intrinsic value: max(S-K, 0) = ${call_intrinsic}")
+    print(f"• Put intrinsic value: max(K-S, 0) = ${put_intrinsic}")
+    print(f"• Call time value: ${C} - ${call_intrinsic} = ${C - call_intrinsic}")
+    print(f"• Put time value: ${put_price:.4f} - ${put_intrinsic} = ${put_price - put_intrinsic:.4f}")
+
+
+if __name__ == "__main__":
+    report()
@@ -0,0 +1,153 @@
+import numpy as np
+
+KINDS = ('conversion', 'reversal', 'box_buy', 'box_sell', 'call_butterfly', 'put_butterfly')
+
+
+def _running_argmax(values, first):
+    """
+    Row index of the running maximum of values within each run of rows
+
+    A run starts wherever first is True. NaN counts as lower than any
+    number. Runs are separated by adding a per-run offset larger than the
+    values' spread, so one maximum.accumulate covers the whole column;
+    the offset can blur near-ties by rounding, so callers recompute the
+    exact values at the chosen rows.
+    """
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.maximum.accumulate(np.where(first, np.arange(values.size), 0))
+    low, high = values[finite].min(), values[finite].max()
+    shifted = np.where(finite, values, low - 1.0) + (high - low + 2.0)*np.cumsum(first)
+    best = np.maximum.accumulate(shifted)
+    return np.maximum.accumulate(np.where(shifted == best, np.arange(values.size), 0))
+
+
+def _lower_hull(T, K, price):
+    """
+    Vertices of each expiry's lower convex hull of (K, price)
+
+    Rows are sorted by (T, K); NaN prices are left out. Each pass drops,
+    across all expiries at once, every remaining point that lies above
+    the chord between its remaining neighbours (such a point is never a
+    hull vertex); a few passes suffice for quoted chains.
+    """
+    keep = np.isfinite(price)
+    while True:
+        idx = np.flatnonzero(keep)
+        a, b, c = idx[:-2], idx[1:-1], idx[2:]
+        inside = (T[a] == T[b]) & (T[b] == T[c])
+        a, b, c = a[inside], b[inside], c[inside]
+        lam = (K[c] - K[b])/(K[c] - K[a])
+        above = price[b] > lam*price[a] + (1 - lam)*price[c]
+        if not above.any():
+            return keep
+        keep[b[above]] = False
+
+
+def scan_chain(T, K, call_bid, call_ask, put_bid, put_ask, S_bid, S_ask=None, r=0.0, q=0.0,
+               rate_spread=0.0, min_edge=0.0):
+    """
+    Static-arbitrage scan of a European option chain at executable prices
+
+    The chain is one row per (expiry T, strike K) with the call and put
+    quotes at that strike (NaN where a side is missing); S_bid/S_ask are
+    the underlying's quotes (S_ask defaults to S_bid), r the lending rate,
+    r + rate_spread the borrowing rate and q the underlying's yield. Rows
+    may come in any order. Every trade is priced at the side it would
+    execute on, so an edge > 0 is a profit after spreads:
+
+    - conversion (long stock and put, short call, financed at the
+      borrowing rate) and reversal (the opposite, proceeds lent at r):
+      put-call parity at each strike
+    - box_buy (financed at the borrowing rate) / box_sell (proceeds lent
+      at r): the K1/K2 box against the discounted width K2 - K1; each
+      upper strike is reported with its most profitable lower strike of
+      the same expiry
+    - call_butterfly / put_butterfly: convexity over strikes K1 < K2 < K3
+      (unequal spacing allowed), whose payoff is never negative; each
+      middle strike is reported with its cheapest pair of wings
+
+    Pairs and triples are not limited to adjacent strikes, since a wide
+    quote at an inner strike can hide a violation between outer ones.
+    Each check is a few passes over the chain rather than a search over
+    all combinations.
+
+    Returns a dict of arrays for the violations with edge > min_edge,
+    ranked by edge (largest first): 'kind' (index into KINDS), 'T',
+    'K_low', 'K_high', 'edge' and 'rows' (the chain rows of the legs, as
+    an (n, 3) array padded with -1).
+    """
+    T, K, cb, ca, pb, pa = np.broadcast_arrays(*(np.ravel(np.asarray(a, dtype=float))
+                                                  for a in (T, K, call_bid, call_ask, put_bid, put_ask)))
+    n = T.size
+    S_ask = S_bid if S_ask is None else S_ask
+    r, q = (np.broadcast_to(np.ravel(np.asarray(a, dtype=float)), (n,)) for a in (r, q))
+    rows = np.arange(n)
+    if n > 1 and not np.all((T[1:] > T[:-1]) | ((T[1:] == T[:-1]) & (K[1:] > K[:-1]))):
+        rows = np.lexsort((K, T))
+        T, K, cb, ca, pb, pa, r, q = (a[rows] for a in (T, K, cb, ca, pb, pa, r, q))
+    disc_lend = np.exp(-r*T)
+    disc_borrow = np.exp(-(r + rate_spread)*T)
+    carry = np.exp(-q*T)
+
+    out = []
+
+    def add(kind, edge, legs, K_low, K_high, T_):
+        # NaN quotes compare False, so missing sides never show up
+        hit = edge > min_edge
+        if hit.any():
+            legs_ = np.full((hit.sum(), 3), -1)
+            for j, leg in enumerate(legs):
+                legs_[:, j] = rows[leg[hit]]
+            out.append((np.full(hit.sum(), kind), T_[hit], K_low[hit], K_high[hit], edge[hit], legs_))
+
+    # put-call parity: C - P = S e^(-qT) - K e^(-rT)
+    everything = np.arange(n)
+    add(0, cb - pa - S_ask*carry + K*disc_borrow, [everything], K, K, T)
+    add(1, pb - ca + S_bid*carry - K*disc_lend, [everything], K, K, T)
+
+    # boxes: the buy edge (K2 - K1)e^(-rT) - (ca1 - cb2 + pa2 - pb1) is a term
+    # in the lower strike plus one in the upper, so each upper strike is
+    # paired with the best lower strike of its expiry by a running maximum.
+    # A bought box pays cash now for K2 - K1 at expiry, so it is financed at
+    # the borrowing rate; a sold box's proceeds are lent at r
+    first = np.ones(n, dtype=bool)
+    first[1:] = T[1:] != T[:-1]
+    hi = np.flatnonzero(~first)
+    for kind, low_leg, disc in ((2, pb - ca - K*disc_borrow, disc_borrow),
+                                (3, cb - pa + K*disc_lend, disc_lend)):
+        lo = _running_argmax(low_leg, first)[hi - 1]
+        width = K[hi] - K[lo]
+        if kind == 2:
+            edge = width*disc[lo] - (ca[lo] - cb[hi] + pa[hi] - pb[lo])
+        else:
+            edge = cb[lo] - ca[hi] + pb[hi] - pa[lo] - width*disc[lo]
+        add(kind, edge, [lo, hi], K[lo], K[hi], T[lo])
+
+    # butterflies: selling strike K2 at the bid against wings K1 < K2 < K3
+    # bought at the ask pays lam*ask(K1) + (1 - lam)*ask(K3) - bid(K2),
+    # lam = (K3 - K2)/(K3 - K1), at expiry never less than zero. The cheapest
+    # wings for K2 are the vertices either side of it on the lower convex
+    # hull of the asks, so each strike is checked once against that hull
+    rows_ = np.arange(n)
+    for kind, bid, ask in ((4, cb, ca), (5, pb, pa)):
+        vertex = _lower_hull(T, K, ask)
+        left = np.maximum.accumulate(np.where(vertex, rows_, -1))
+        right = np.minimum.accumulate(np.where(vertex, rows_, n)[::-1])[::-1]
+        b = rows_[1:-1]
+        a, c = left[:-2], right[2:]
+        ok = (a >= 0) & (c < n)
+        a, b, c = a[ok], b[ok], c[ok]
+        same = (T[a] == T[b]) & (T[c] == T[b])
+        a, b, c = a[same], b[same], c[same]
+        lam = (K[c] - K[b])/(K[c] - K[a])
+        add(kind, bid[b] - lam*ask[a] - (1 - lam)*ask[c], [a, b, c], K[a], K[c], T[a])
+
+    if out:
+        kind, T_, K_low, K_high, edge, legs = (np.concatenate(col) for col in zip(*out))
+    else:
+        kind, T_, K_low, K_high, edge, legs = (np.empty(0, dtype=int), np.empty(0), np.empty(0),
+                                               np.empty(0), np.empty(0), np.empty((0, 3), dtype=int))
+    order = np.argsort(-edge, kind='stable')
+    return {'kind': kind[order], 'T': T_[order], 'K_low': K_low[order], 'K_high': K_high[order],
+            'edge': edge[order], 'rows': legs[order]}
@@ -0,0 +1,63 @@
+import math
+import sys
+import time
+import tracemalloc
+
+from binomial import binomial_price
+
+# Benchmark: rolling-array lattice vs the dict-of-tuples tree from A6Q11.py
+# Usage: python bench_binomial.py [max_dict_steps]
+S0, K, r, q, sg, T = 484, 480, 0.10, 0.03, 0.25, 2/12
+steps = [100, 500, 1000, 2000, 5000, 10000]
+
+
+def dict_tree_put(S0, K, r, q, sg, T, n):
+    """American put on the dict-of-tuples tree, as written in A6Q11.py"""
+    dt = T/n
+    u, d = math.exp(sg*(dt)**0.5), math.exp(-sg*(dt)**0.5)
+    p, disc = (math.exp((r-q)*dt)-d)/(u-d), math.exp(-r*dt)
+    S = {(i,j): S0*u**(i-j)*d**j for i in range(n+1) for j in range(i+1)}
+    P = {(n,j): max(0, K-S[n,j]) for j in range(n+1)}
+    for i in range(n-1, -1, -1):
+        for j in range(i+1):
+            cont = disc * (p*P[i+1,j] + (1-p)*P[i+1,j+1])
+            exercise = max(0, K-S[i,j])
+            P[i,j] = max(cont, exercise)
+    return P[0,0]
+
+
+def measure(fn):
+    """Return (result, seconds, peak traced memory in MB)
+
+    tracemalloc slows allocation-heavy code a lot, so the timing comes from
+    a separate untraced run.
+    """
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak/2**20
+
+
+if __name__ == "__main__":
+    # The dict tree is O(n^2) in time and memory; above this n it is skipped
+    max_dict = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print("=" * 84)
+    print(f"AMERICAN PUT LATTICE SCALING (S0={S0}, K={K}, r={r}, q={q}, sigma={sg}, T={T:.4f})")
+    print("=" * 84)
+    print(f"{'n':>6} {'dict (s)':>10} {'dict MB':>9} {'array (s)':>11} {'array MB':>9} {'speedup':>9} {'price':>12}")
+
+    for n in steps:
+        price, t_arr, mb_arr = measure(lambda: binomial_price(S0, K, r, sg, T, n, q=q))
+
+        if n <= max_dict:
+            ref, t_dict, mb_dict = measure(lambda: dict_tree_put(S0, K, r, q, sg, T, n))
+            assert abs(ref - price) < 1e-9, (ref, price)
+            print(f"{n:>6} {t_dict:>10.3f} {mb_dict:>9.1f} {t_arr:>11.5f} {mb_arr:>9.3f} "
+                  f"{t_dict/t_arr:>8.0f}x {price:>12.6f}")
+        else:
+            print(f"{n:>6} {'skipped':>10} {'-':>9} {t_arr:>11.5f} {mb_arr:>9.3f} {'-':>9} {price:>12.6f}")
@@ -0,0 +1,54 @@
+import sys
+import time
+
+import numpy as np
+
+from binomial import binomial_price, binomial_price_batch
+from bench_binomial import dict_tree_put
+
+# Benchmark: batch American pricer vs looping the single-contract code
+# Usage: python bench_binomial_batch.py [n_steps]
+books = [100, 1000, 10000]
+dict_sample = 20   # contracts priced with the A6Q11 dict tree to estimate its rate
+
+
+def make_book(m, seed=0):
+    """Random book of m American puts around the A6Q11 contract"""
+    rng = np.random.default_rng(seed)
+    S0 = rng.uniform(400, 560, m)
+    K = rng.uniform(400, 560, m)
+    r = rng.uniform(0.0, 0.10, m)
+    q = rng.uniform(0.0, 0.05, m)
+    sigma = rng.uniform(0.10, 0.50, m)
+    T = rng.uniform(1/12, 1.0, m)
+    return S0, K, r, q, sigma, T
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("=" * 80)
+    print(f"BATCH AMERICAN PUT PRICING (n={n} steps)")
+    print("=" * 80)
+
+    S0, K, r, q, sigma, T = make_book(dict_sample)
+    t0 = time.perf_counter()
+    for c in range(dict_sample):
+        dict_tree_put(S0[c], K[c], r[c], q[c], sigma[c], T[c], n)
+    dict_rate = dict_sample/(time.perf_counter() - t0)
+    print(f"dict tree (A6Q11) loop: {dict_rate:,.1f} contracts/s (from {dict_sample} contracts)\n")
+
+    print(f"{'contracts':>10} {'loop (s)':>10} {'loop c/s':>12} {'batch (s)':>10} {'batch c/s':>12} {'speedup':>9} {'max |diff|':>11}")
+    for m in books:
+        S0, K, r, q, sigma, T = make_book(m)
+
+        t0 = time.perf_counter()
+        looped = np.array([binomial_price(S0[c], K[c], r[c], sigma[c], T[c], n, q=q[c]) for c in range(m)])
+        t_loop = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        batch = binomial_price_batch(S0, K, r, sigma, T, n, q=q)
+        t_batch = time.perf_counter() - t0
+
+        print(f"{m:>10} {t_loop:>10.3f} {m/t_loop:>12,.0f} {t_batch:>10.3f} {m/t_batch:>12,.0f} "
+              f"{t_loop/t_batch:>8.1f}x {np.abs(looped - batch).max():>11.2e}")
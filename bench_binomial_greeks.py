@@ -0,0 +1,40 @@
+import sys
+
+from bench_suite import timed
+from binomial import binomial_greeks, binomial_price
+
+# Benchmark: tree Greeks from one induction (+2 bumps) vs bumped re-runs
+# Usage: python bench_binomial_greeks.py [n_steps]
+S0, K, r, q, sg, T = 484, 480, 0.10, 0.03, 0.25, 2/12
+
+
+def bumped_greeks(n, h=1e-4):
+    """Greeks by re-running the tree with bumped inputs (6 runs)"""
+    price = lambda S0=S0, r=r, sg=sg, T=T: binomial_price(S0, K, r, sg, T, n, q=q)
+    dS = 0.01*S0
+    base, up, down = price(), price(S0=S0 + dS), price(S0=S0 - dS)
+    return {
+        'price': base,
+        'delta': (up - down)/(2*dS),
+        'gamma': (up - 2*base + down)/dS**2,
+        'theta': (price(T=T - h) - base)/h,
+        'vega': (price(sg=sg + h) - base)/h,
+        'rho': (price(r=r + h) - base)/h,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    bumped, t_bump = timed(lambda: bumped_greeks(n), repeat=5)
+    tree, t_tree = timed(lambda: binomial_greeks(S0, K, r, sg, T, n, q=q), repeat=5)
+    full, t_full = timed(lambda: binomial_greeks(S0, K, r, sg, T, n, q=q, vega_rho=True), repeat=5)
+
+    print("=" * 60)
+    print(f"AMERICAN PUT TREE GREEKS (n={n})")
+    print("=" * 60)
+    print(f"bumped re-runs (6 trees):         {t_bump*1e3:8.2f} ms")
+    print(f"tree Greeks (1 tree):             {t_tree*1e3:8.2f} ms  ({t_bump/t_tree:.1f}x)")
+    print(f"tree Greeks + vega/rho (3 trees): {t_full*1e3:8.2f} ms  ({t_bump/t_full:.1f}x)")
+    print(f"\n{'':>6} {'bumped':>12} {'from tree':>12}")
+    for g in ('price', 'delta', 'gamma', 'theta', 'vega', 'rho'):
+        print(f"{g:>6} {bumped[g]:>12.6f} {full[g]:>12.6f}")
@@ -0,0 +1,68 @@
+import sys
+import time
+
+import numpy as np
+from bench_suite import timed
+from scipy.stats import norm
+
+from black_scholes import black_scholes
+
+# Benchmark: batch Black-Scholes vs the per-strike dict-comprehension loop
+# Usage: python bench_black_scholes.py [max_loop_size]
+S, r, sigma = 32, 0.05, 0.30
+sizes = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+
+def bs_call(S, K, T, r, sigma):
+    """Per-contract call price as written in A6Q8_short.py"""
+    d1 = (np.log(S/K) + (r + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
+    d2 = d1 - sigma*np.sqrt(T)
+    return S*norm.cdf(d1) - K*np.exp(-r*T)*norm.cdf(d2)
+
+
+def bs_put(S, K, T, r, sigma):
+    """Per-contract put price as written in A6Q8_short.py"""
+    d1 = (np.log(S/K) + (r + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
+    d2 = d1 - sigma*np.sqrt(T)
+    return K*np.exp(-r*T)*norm.cdf(-d2) - S*norm.cdf(-d1)
+
+
+def make_chain(n, seed=0):
+    """Random strike x expiry chain of n contracts around S"""
+    rng = np.random.default_rng(seed)
+    K = rng.uniform(0.5*S, 1.5*S, n)
+    T = rng.uniform(1/52, 2.0, n)
+    return K, T
+
+
+if __name__ == "__main__":
+    # The scalar loop costs ~100 us per contract; above this size it is skipped
+    max_loop = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+
+    print("=" * 78)
+    print("BLACK-SCHOLES BENCHMARK: batch engine vs per-strike loop (calls + puts)")
+    print("=" * 78)
+    print(f"{'contracts':>10} {'loop (s)':>12} {'batch (s)':>12} {'speedup':>10} {'batch Mc/s':>12} {'max |diff|':>12}")
+
+    for n in sizes:
+        K, T = make_chain(n)
+        t_batch = timed(lambda: black_scholes(S, K, T, r, sigma), repeat=3 if n < 10**7 else 1)[1]
+        calls, puts = black_scholes(S, K, T, r, sigma)
+
+        if n <= max_loop:
+            pairs = list(zip(K.tolist(), T.tolist()))
+
+            def loop():
+                c = {(k, t): bs_call(S, k, t, r, sigma) for k, t in pairs}
+                p = {(k, t): bs_put(S, k, t, r, sigma) for k, t in pairs}
+                return c, p
+
+            t0 = time.perf_counter()
+            c_loop, p_loop = loop()
+            t_loop = time.perf_counter() - t0
+            err = max(np.max(np.abs(np.fromiter(c_loop.values(), float) - calls)),
+                      np.max(np.abs(np.fromiter(p_loop.values(), float) - puts)))
+            print(f"{n:>10} {t_loop:>12.4f} {t_batch:>12.5f} {t_loop/t_batch:>9.0f}x "
+                  f"{n/t_batch/1e6:>12.2f} {err:>12.2e}")
+        else:
+            print(f"{n:>10} {'skipped':>12} {t_batch:>12.5f} {'-':>10} {n/t_batch/1e6:>12.2f} {'-':>12}")
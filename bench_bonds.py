@@ -0,0 +1,53 @@
+import time
+
+import numpy as np
+
+from bonds import bond_analytics, bond_price, bond_yield
+
+# Benchmark: batch bond analytics and yield solving vs a per-bond loop
+# Usage: python bench_bonds.py
+sizes = [10**3, 10**4, 10**5]
+frequency = 2
+
+
+def make_bonds(n, seed=0):
+    """Random semi-annual bonds: coupon, maturity (years) and yield"""
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.0, 0.10, n), rng.uniform(0.5, 30, n), rng.uniform(0.0, 0.12, n)
+
+
+def loop_analytics(c, m, y):
+    """A6Q2-style price and Macaulay duration, one bond at a time"""
+    out = []
+    for coupon, maturity, ytm in zip(c.tolist(), m.tolist(), y.tolist()):
+        t_c = np.arange(maturity, 0, -1/frequency)[::-1]
+        cf = np.full(t_c.size, 100*coupon/frequency)
+        cf[-1] += 100
+        pv = cf*np.exp(-ytm*t_c)
+        price = pv.sum()
+        out.append((price, np.dot(pv, t_c)/price))
+    return out
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("BOND ANALYTICS: price/duration/convexity/DV01 and yield solving")
+    print("=" * 80)
+    print(f"{'bonds':>8} {'loop (s)':>10} {'analytics (s)':>14} {'speedup':>9} "
+          f"{'yield (s)':>10} {'max |y err|':>12}")
+    for n in sizes:
+        c, m, y = make_bonds(n)
+        t0 = time.perf_counter()
+        res = bond_analytics(c, m, y, frequency)
+        t_batch = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        loop = loop_analytics(c, m, y)
+        t_loop = time.perf_counter() - t0
+        assert np.allclose([p for p, _ in loop], res['price'])
+
+        price = bond_price(c, m, y, frequency)
+        t0 = time.perf_counter()
+        solved = bond_yield(price, c, m, frequency)
+        t_yield = time.perf_counter() - t0
+        print(f"{n:>8} {t_loop:>10.4f} {t_batch:>14.4f} {t_loop/t_batch:>8.0f}x "
+              f"{t_yield:>10.4f} {np.max(np.abs(solved - y)):>12.2e}")
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+from cashflows import CashflowBook
+from curve import YieldCurve
+
+# Benchmark: columnar cashflow book vs the per-cashflow PV loop of A6Q1.py
+# Usage: python bench_cashflows.py
+r = 4.33/100
+sizes = [10**4, 10**5, 10**6, 10**7]
+instruments = 10**4
+
+
+def make_book(n, seed=0):
+    """n irregular cashflows spread over `instruments` instruments"""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, instruments, n), rng.uniform(0.01, 30, n), rng.uniform(10, 1000, n)
+
+
+def loop_pv(ids, t, amount):
+    """A6Q1-style loop, with a float output so it is comparable"""
+    df = np.exp(-r*t)
+    pv = np.zeros(instruments)
+    for i in range(len(amount)):
+        pv[ids[i]] += amount[i]*df[i]
+    return pv
+
+
+if __name__ == "__main__":
+    curve = YieldCurve.flat(r)
+    print("=" * 100)
+    print("CASHFLOW BOOK: per-instrument PV of irregular cashflows")
+    print("=" * 100)
+    print(f"{'cashflows':>10} {'loop (s)':>10} {'build (s)':>10} {'revalue (s)':>12} "
+          f"{'update 10 (ms)':>15} {'append 10 (ms)':>15} {'max |diff|':>12}")
+    rng = np.random.default_rng(1)
+    for n in sizes:
+        ids, t, amount = make_book(n)
+        t0 = time.perf_counter()
+        book = CashflowBook(ids, t, amount, curve)
+        t_build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        book.set_curve(curve)
+        t_reval = time.perf_counter() - t0
+
+        # a few cashflows change between revaluations
+        idx = rng.integers(0, n, 10)
+        t0 = time.perf_counter()
+        book.update(idx, amount=rng.uniform(10, 1000, 10), time=rng.uniform(0.01, 30, 10))
+        t_update = time.perf_counter() - t0
+        # and a few are added, some for new instruments
+        t0 = time.perf_counter()
+        book.append(rng.integers(0, instruments + 10, 10), rng.uniform(0.01, 30, 10),
+                    rng.uniform(10, 1000, 10))
+        t_append = time.perf_counter() - t0
+        full = np.bincount(book.codes, book.amount*np.exp(-r*book.time), minlength=book.ids.size)
+        err = np.max(np.abs(book.pv() - full))
+
+        if n <= 10**5:
+            t0 = time.perf_counter()
+            loop_pv(ids, t, amount)
+            t_loop = f"{time.perf_counter() - t0:>10.4f}"
+        else:
+            t_loop = f"{'skipped':>10}"
+        print(f"{n:>10} {t_loop} {t_build:>10.4f} {t_reval:>12.4f} {t_update*1e3:>15.3f} "
+              f"{t_append*1e3:>15.3f} {err:>12.2e}")
@@ -0,0 +1,34 @@
+from bench_suite import timed
+from binomial import binomial_price
+from black_scholes import black_scholes
+
+# Benchmark: accuracy vs time for plain CRR, BBS and BBS + Richardson
+# Usage: python bench_convergence.py
+steps = [24, 50, 100, 200, 400, 800, 1600]
+methods = ['crr', 'bbs', 'bbsr']
+# European put from A6Q9 (exact Black-Scholes reference) and the A6Q11 American put
+european = dict(S0=30, K=29, r=0.05, sigma=0.25, T=4/12, q=0.0, american=False)
+american = dict(S0=484, K=480, r=0.10, sigma=0.25, T=2/12, q=0.03, american=True)
+
+
+def report(title, params, reference):
+    """Print |error| and time for each method and n"""
+    print(f"\n{title} (reference {reference:.6f})")
+    print(f"{'n':>6}" + "".join(f" {m + ' err':>11} {m + ' ms':>9}" for m in methods))
+    for n in steps:
+        row = f"{n:>6}"
+        for m in methods:
+            value, t = timed(lambda: binomial_price(n=n, option='put', method=m, **params), repeat=5)
+            row += f" {abs(value - reference):>11.2e} {t*1e3:>9.3f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    print("=" * 66)
+    print("BINOMIAL CONVERGENCE: error vs time (put options)")
+    print("=" * 66)
+    e = european
+    report("European put", european, float(black_scholes(e['S0'], e['K'], e['T'], e['r'], e['sigma'])[1]))
+    # no closed form for the American put; use a very fine extrapolated tree
+    reference = binomial_price(n=20000, option='put', method='bbsr', **american)
+    report("American put", american, reference)
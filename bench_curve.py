@@ -0,0 +1,52 @@
+import numpy as np
+
+from bench_suite import timed
+from curve import YieldCurve
+
+# Benchmark: curve discounting vs flat-rate discounting of a cashflow book
+# Usage: python bench_curve.py
+r = 4.33/100
+sizes = [10**3, 10**5, 10**6, 10**7]
+# a 2y-30y bootstrapped par curve
+maturities = [0.5, 1, 2, 3, 5, 7, 10, 20, 30]
+par_rates = [0.043, 0.042, 0.040, 0.039, 0.039, 0.040, 0.041, 0.044, 0.045]
+
+
+def make_cashflows(n, seed=0):
+    """n cashflows on a repeated grid of quarterly dates out to 30 years"""
+    rng = np.random.default_rng(seed)
+    dates = np.arange(1, 121)/4
+    return rng.uniform(10, 1000, n), dates[rng.integers(0, dates.size, n)]
+
+
+if __name__ == "__main__":
+    curves = {
+        'log_linear': YieldCurve.bootstrap(maturities, par_rates, frequency=2),
+        'monotone_cubic': YieldCurve.bootstrap(maturities, par_rates, frequency=2, interpolation='monotone_cubic'),
+    }
+    print("=" * 86)
+    print("CURVE DISCOUNTING: PV of a cashflow book")
+    print("=" * 86)
+    print(f"{'cashflows':>10} {'loop (s)':>10} {'flat exp (s)':>13} "
+          + "".join(f" {name + ' miss/hit (s)':>27}" for name in curves))
+    for n in sizes:
+        cf, t = make_cashflows(n)
+        if n <= 10**5:
+            def loop():
+                # the per-cashflow loop of A6Q1.py
+                df = np.exp(-r*t)
+                pv = np.zeros_like(cf)
+                for i in range(len(cf)):
+                    pv[i] = cf[i]*df[i]
+                return pv.sum()
+            t_loop = f"{timed(loop, repeat=1)[1]:>10.4f}"
+        else:
+            t_loop = f"{'skipped':>10}"
+        t_flat = timed(lambda: np.dot(cf, np.exp(-r*t)))[1]
+        row = f"{n:>10} {t_loop} {t_flat:>13.4f}"
+        for curve in curves.values():
+            curve.cache.clear()
+            t_miss = timed(lambda: np.dot(cf, curve.df(t)), repeat=1)[1]
+            t_hit = timed(lambda: np.dot(cf, curve.df(t)))[1]
+            row += f" {t_miss:>13.4f} / {t_hit:>11.4f}"
+        print(row)
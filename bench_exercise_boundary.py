@@ -0,0 +1,43 @@
+import numpy as np
+
+from bench_suite import timed
+from binomial import binomial_price, exercise_boundary, lattice_nodes
+
+# Benchmark: recording the early-exercise boundary during the induction
+# Usage: python bench_exercise_boundary.py
+#
+# The alternative is A6Q10's original approach: keep every step of the
+# tree (lattice_nodes) and scan it afterwards for exercised nodes.
+r, sigma, T, q = 0.05, 0.25, 0.5, 0.0
+steps = [100, 500, 2000, 5000]
+full_tree_max_steps = 2000  # lattice_nodes is O(n^2) in memory
+
+
+def scan_boundary(S0, K, n):
+    """Critical put price per step from a full tree, scanned after the induction"""
+    S, V = lattice_nodes(S0, K, r, sigma, T, n, q)
+    S_star = np.full(n, np.nan)
+    for i in range(n):
+        hit = V[i] <= np.maximum(K - S[i], 0.0) + 1e-12
+        hit &= K > S[i]
+        if hit.any():
+            S_star[i] = S[i][hit].max()
+    return float(V[0][0]), S_star
+
+
+if __name__ == "__main__":
+    print("=" * 87)
+    print("EXERCISE BOUNDARY: price only vs recorded in the induction vs full-tree scan")
+    print("=" * 87)
+    print(f"{'n':>6} {'price only (ms)':>16} {'recorded (ms)':>14} {'tree scan (ms)':>15} {'max |diff|':>12} {'same boundary':>14}")
+    S0, K = 100.0, 100.0
+    for n in steps:
+        plain, t_plain = timed(lambda: binomial_price(S0, K, r, sigma, T, n, q), repeat=1)
+        (price, tau, S_star), t_record = timed(lambda: exercise_boundary(S0, K, r, sigma, T, n, q), repeat=1)
+        scan, diff, same = '-', abs(price - plain), '-'
+        if n <= full_tree_max_steps:
+            (scanned, scanned_star), t_scan = timed(lambda: scan_boundary(S0, K, n), repeat=1)
+            scan = f'{t_scan*1e3:.1f}'
+            diff = max(diff, abs(scanned - price))
+            same = 'yes' if np.allclose(scanned_star, S_star, rtol=1e-12, equal_nan=True) else 'no'
+        print(f"{n:>6} {t_plain*1e3:>16.1f} {t_record*1e3:>14.1f} {scan:>15} {diff:>12.2e} {same:>14}")
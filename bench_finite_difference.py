@@ -0,0 +1,76 @@
+import numpy as np
+
+from bench_suite import timed
+from binomial import binomial_price, binomial_price_batch
+from finite_difference import fd_price
+
+# Benchmark: Crank-Nicolson PDE engine against the binomial lattice at equal accuracy
+# Usage: python bench_finite_difference.py
+#
+# For each error target, every method runs at the smallest size (tree
+# steps, or PDE space steps) on the grid below that meets it, and is
+# timed there. References are BBS + Richardson trees with 20000 steps.
+american = dict(r=0.10, sigma=0.25, T=2/12, q=0.03)  # the A6Q11 put
+S0, K0 = 484, 480
+ladder = np.arange(400, 561, 4.0)  # 41 strikes
+targets = [1e-2, 1e-3, 2e-4]
+sizes = sorted({int(round(10*1.25**k/2))*2 for k in range(30)})
+methods = {
+    'CRR tree': lambda n, K: binomial_price(S0, K, n=n, option='put', **american),
+    'BBS-R tree': lambda n, K: binomial_price(S0, K, n=n, option='put', method='bbsr', **american),
+    'CN PDE': lambda n, K: fd_price(S0, K, n=n, option='put', **american),
+}
+ladder_methods = {
+    'CRR batch': lambda n: binomial_price_batch(S0, ladder, n=n, option='put', **american),
+    'CN PDE': lambda n: fd_price(S0, ladder, n=n, option='put', **american),
+}
+
+
+def smallest_size(error, tol):
+    """Smallest size whose error is within tol, or None"""
+    for n in sizes:
+        if error(n) <= tol:
+            return n
+    return None
+
+
+def equal_accuracy(title, error, run):
+    """Print the size and time each method needs for each error target"""
+    print(f"\n{title}")
+    print(f"{'target':>8}" + "".join(f" {m + ' n':>13} {'ms':>8}" for m in run))
+    for tol in targets:
+        row = f"{tol:>8.0e}"
+        for m in run:
+            n = smallest_size(lambda n: error(m, n), tol)
+            if n is None:
+                row += f" {'-':>13} {'-':>8}"
+            else:
+                row += f" {n:>13} {timed(lambda: run[m](n))[1]*1e3:>8.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    print("=" * 76)
+    print("AMERICAN PUT: CRANK-NICOLSON PDE vs BINOMIAL LATTICE")
+    print("=" * 76)
+    reference = binomial_price(S0, K0, n=20000, option='put', method='bbsr', **american)
+    ladder_reference = np.array([binomial_price(S0, K, n=20000, option='put', method='bbsr', **american)
+                                 for K in ladder.tolist()])
+
+    errors = {}
+
+    def single_error(m, n):
+        if (m, n) not in errors:
+            errors[m, n] = abs(methods[m](n, K0) - reference)
+        return errors[m, n]
+
+    def ladder_error(m, n):
+        if (m, n) not in errors:
+            errors[m, n] = np.abs(ladder_methods[m](n) - ladder_reference).max()
+        return errors[m, n]
+
+    equal_accuracy(f"one contract, S={S0} K={K0} (reference {reference:.6f}); |error| target",
+                   single_error, {m: (lambda f: lambda n: f(n, K0))(f) for m, f in methods.items()})
+    equal_accuracy(f"strike ladder, {ladder.size} strikes {ladder[0]:g}-{ladder[-1]:g}; max |error| target",
+                   ladder_error, ladder_methods)
+    print("\nthe PDE prices the whole ladder from one grid; the batched tree runs one tree per strike")
@@ -0,0 +1,57 @@
+import math
+import time
+
+import numpy as np
+
+from forwards import ForwardBook
+
+# Benchmark: per-tick revaluation of a forward book vs rescanning every contract
+# Usage: python bench_forwards.py
+r = 0.05
+n_ticks = 10**5
+books = [(10**4, 100), (5*10**4, 500), (10**5, 100)]
+
+
+def make_book(n, n_underlyings, seed=0):
+    """n forwards on n_underlyings underlyings with random terms"""
+    rng = np.random.default_rng(seed)
+    return (rng.integers(0, n_underlyings, n), rng.uniform(50, 150, n), rng.uniform(0.01, 2, n),
+            rng.uniform(0, 0.05, n), rng.choice([-1.0, 1.0], n), rng.uniform(50, 150, n_underlyings))
+
+
+if __name__ == "__main__":
+    print("=" * 82)
+    print("FORWARD BOOK: mark-to-market on each price tick")
+    print("=" * 82)
+    print(f"{'contracts':>10} {'underlyings':>12} {'full reval (us)':>16} {'A6Q4 loop (us)':>15} "
+          f"{'tick (us)':>10} {'max |diff|':>12}")
+    rng = np.random.default_rng(1)
+    for n, n_und in books:
+        und, K, T, q, qty, spot = make_book(n, n_und)
+        book = ForwardBook(und, K, T, r, q, qty, spot=spot)
+        ticks = rng.integers(0, n_und, n_ticks)
+        prices = spot[ticks]*(1 + rng.normal(0, 1e-3, n_ticks))
+
+        # vectorized revaluation of the whole book per tick
+        t0 = time.perf_counter()
+        for u, p in zip(ticks[:1000].tolist(), prices[:1000].tolist()):
+            spot[u] = p
+            qty*(spot[und]*np.exp(-q*T) - K*np.exp(-r*T))
+        t_full = (time.perf_counter() - t0)/1000
+
+        # scalar math.exp per contract, as forward_contract_value in A6Q4
+        t0 = time.perf_counter()
+        for u, s, k, t, y in zip(und.tolist(), spot[und].tolist(), K.tolist(), T.tolist(), q.tolist()):
+            s*math.exp(-y*t) - k*math.exp(-r*t)
+        t_loop = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for u, p in zip(ticks.tolist(), prices.tolist()):
+            book.tick(u, p)
+        t_tick = (time.perf_counter() - t0)/n_ticks
+
+        for u, p in zip(ticks.tolist(), prices.tolist()):
+            spot[u] = p
+        exact = qty*(spot[und]*np.exp(-q*T) - K*np.exp(-r*T))
+        err = max(np.max(np.abs(book.values() - exact)), abs(book.value() - exact.sum()))
+        print(f"{n:>10} {n_und:>12} {t_full*1e6:>16.1f} {t_loop*1e6:>15.1f} {t_tick*1e6:>10.2f} {err:>12.2e}")
@@ -0,0 +1,43 @@
+import sys
+
+import numpy as np
+
+from bench_suite import timed
+from black_scholes import black_scholes, black_scholes_greeks
+
+# Benchmark: one-pass analytic Greeks vs bump-and-reprice
+# Usage: python bench_greeks.py [n_contracts]
+S, r = 100.0, 0.05
+h = 1e-4
+
+
+def bumped_greeks(K, T, sigma):
+    """Central-difference call Greeks, as the hedging loop does today (9 pricings)"""
+    price = black_scholes(S, K, T, r, sigma)[0]
+    up, down = black_scholes(S + h, K, T, r, sigma)[0], black_scholes(S - h, K, T, r, sigma)[0]
+    vega = (black_scholes(S, K, T, r, sigma + h)[0] - black_scholes(S, K, T, r, sigma - h)[0])/(2*h)
+    theta = -(black_scholes(S, K, T + h, r, sigma)[0] - black_scholes(S, K, T - h, r, sigma)[0])/(2*h)
+    rho = (black_scholes(S, K, T, r + h, sigma)[0] - black_scholes(S, K, T, r - h, sigma)[0])/(2*h)
+    return {'price': price, 'delta': (up - down)/(2*h), 'gamma': (up - 2*price + down)/h**2,
+            'vega': vega, 'theta': theta, 'rho': rho}
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rng = np.random.default_rng(0)
+    K = rng.uniform(0.6*S, 1.6*S, n)
+    T = rng.uniform(1/12, 2.0, n)
+    sigma = rng.uniform(0.10, 0.80, n)
+
+    print("=" * 64)
+    print(f"GREEKS BENCHMARK ({n:,} calls)")
+    print("=" * 64)
+    bumped, t_bump = timed(lambda: bumped_greeks(K, T, sigma))
+    full, t_full = timed(lambda: black_scholes_greeks(S, K, T, r, sigma))
+    subset, t_sub = timed(lambda: black_scholes_greeks(S, K, T, r, sigma, greeks=('delta', 'vega')))
+    print(f"bump and reprice:       {t_bump:.3f}s")
+    print(f"analytic, all Greeks:   {t_full:.3f}s  ({t_bump/t_full:.1f}x)")
+    print(f"analytic, delta + vega: {t_sub:.3f}s  ({t_bump/t_sub:.1f}x)")
+    print("\nmax |analytic - bumped|:")
+    for g in ('delta', 'vega', 'theta', 'rho'):
+        print(f"  {g:<6} {np.abs(full[g] - bumped[g]).max():.2e}")
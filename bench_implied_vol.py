@@ -0,0 +1,69 @@
+import sys
+import time
+
+import numpy as np
+from scipy.optimize import brentq
+
+from black_scholes import black_scholes, black_scholes_call, black_scholes_put
+from implied_vol import implied_vol
+
+# Benchmark: vectorized implied vol vs a per-quote brentq loop
+# Usage: python bench_implied_vol.py [n_quotes]
+S, r = 100.0, 0.05
+loop_sample = 2000
+
+
+def make_quotes(n, seed=0):
+    """Random chain of call and put quotes with known vols, plus 1% bad quotes"""
+    rng = np.random.default_rng(seed)
+    K = rng.uniform(0.6*S, 1.6*S, n)
+    T = rng.uniform(1/52, 2.0, n)
+    sigma = rng.uniform(0.10, 0.80, n)
+    is_call = rng.random(n) < 0.5
+    call, put = black_scholes(S, K, T, r, sigma)
+    price = np.where(is_call, call, put)
+    # push some quotes through the no-arbitrage bounds
+    bad = rng.random(n) < 0.01
+    price[bad] = np.where(rng.random(bad.sum()) < 0.5, 0.0, np.where(is_call[bad], S, K[bad]) + 1)
+    return price, K, T, sigma, is_call, bad
+
+
+def brentq_vol(price, K, T, is_call):
+    """One quote at a time with scipy's root finder"""
+    f = black_scholes_call if is_call else black_scholes_put
+    try:
+        return brentq(lambda s: f(S, K, T, r, s) - price, 1e-6, 10.0, xtol=1e-12)
+    except ValueError:
+        return np.nan
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    price, K, T, sigma, is_call, bad = make_quotes(n)
+
+    print("=" * 70)
+    print(f"IMPLIED VOLATILITY BENCHMARK ({n:,} quotes, {bad.sum():,} outside bounds)")
+    print("=" * 70)
+
+    times = []
+    for _ in range(3):
+        t0 = time.perf_counter()
+        iv, status = implied_vol(price, S, K, T, r, is_call, full_output=True)
+        times.append(time.perf_counter() - t0)
+    t_vec = min(times)
+    ok = status == 0
+    # vol is only identifiable where the price is sensitive to it
+    bumped_call, bumped_put = black_scholes(S, K, T, r, sigma + 1e-4)
+    identifiable = ~bad & (np.abs(np.where(is_call, bumped_call, bumped_put) - price) > 1e-9)
+    print(f"vectorized: {t_vec:.3f}s  ({n/t_vec/1e6:.2f}M quotes/s)")
+    print(f"status counts (converged, below, above, not converged): {np.bincount(status, minlength=4).tolist()}")
+    print(f"bad quotes flagged: {np.all(status[bad] != 0)}")
+    print(f"max |iv - sigma| on identifiable quotes: {np.abs(iv - sigma)[ok & identifiable].max():.2e}")
+
+    m = min(loop_sample, n)
+    t0 = time.perf_counter()
+    loop_iv = np.array([brentq_vol(price[i], K[i], T[i], is_call[i]) for i in range(m)])
+    t_loop = (time.perf_counter() - t0)/m*n
+    print(f"\nbrentq loop: {t_loop:.1f}s estimated for {n:,} quotes (timed on {m:,})")
+    print(f"speedup: {t_loop/t_vec:.0f}x, max |diff| vs brentq: "
+          f"{np.nanmax(np.abs(loop_iv - iv[:m])[ok[:m] & identifiable[:m]]):.2e}")
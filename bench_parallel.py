@@ -0,0 +1,55 @@
+import os
+import sys
+
+import numpy as np
+
+from bench_suite import timed
+from binomial import binomial_price_batch
+from black_scholes import black_scholes
+from parallel import binomial_price_parallel, black_scholes_parallel, make_pool
+
+# Benchmark: shared-memory process-pool pricing with 1, 2, 4 and 8 workers
+# Usage: python bench_parallel.py [bs_contracts] [tree_contracts]
+worker_counts = [1, 2, 4, 8]
+n_steps = 200
+
+
+def make_book(m, seed=0):
+    """Random book of m contracts: (S, K, T, r, q, sigma)"""
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(20, 60, m)
+    K = rng.uniform(20, 60, m)
+    T = rng.uniform(1/52, 2.0, m)
+    r = rng.uniform(0.0, 0.10, m)
+    q = rng.uniform(0.0, 0.05, m)
+    sigma = rng.uniform(0.10, 0.50, m)
+    return S, K, T, r, q, sigma
+
+
+if __name__ == "__main__":
+    n_bs = int(sys.argv[1]) if len(sys.argv) > 1 else 4*10**6
+    n_tree = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    print("=" * 72)
+    print(f"SHARDED PRICING BENCHMARK ({os.cpu_count()} CPUs visible)")
+    print("=" * 72)
+
+    S, K, T, r, q, sigma = make_book(max(n_bs, n_tree))
+    (c_ref, p_ref), t_bs = timed(lambda: black_scholes(S[:n_bs], K[:n_bs], T[:n_bs], r[:n_bs], sigma[:n_bs], q[:n_bs]), repeat=1)
+    tree_ref, t_tree = timed(lambda: binomial_price_batch(S[:n_tree], K[:n_tree], r[:n_tree], sigma[:n_tree],
+                                                          T[:n_tree], n_steps, q=q[:n_tree]), repeat=1)
+    print(f"in-process: Black-Scholes {n_bs:,} contracts {t_bs:.3f}s, "
+          f"American tree {n_tree:,} contracts (n={n_steps}) {t_tree:.3f}s\n")
+
+    print(f"{'workers':>8} {'BS (s)':>9} {'BS speedup':>11} {'tree (s)':>9} {'tree speedup':>13} {'max |diff|':>11}")
+    for w in worker_counts:
+        # the pool is started up front; only the sharded pricing is timed
+        with make_pool(w) as pool:
+            list(pool.map(abs, range(w)))
+            (c, p), t_w_bs = timed(lambda: black_scholes_parallel(
+                S[:n_bs], K[:n_bs], T[:n_bs], r[:n_bs], sigma[:n_bs], q[:n_bs], workers=w, pool=pool), repeat=1)
+            tree, t_w_tree = timed(lambda: binomial_price_parallel(
+                S[:n_tree], K[:n_tree], r[:n_tree], sigma[:n_tree], T[:n_tree], n_steps,
+                q=q[:n_tree], workers=w, pool=pool), repeat=1)
+        err = max(np.abs(c - c_ref).max(), np.abs(p - p_ref).max(), np.abs(tree - tree_ref).max())
+        print(f"{w:>8} {t_w_bs:>9.3f} {t_bs/t_w_bs:>10.2f}x {t_w_tree:>9.3f} {t_tree/t_w_tree:>12.2f}x {err:>11.2e}")
@@ -0,0 +1,97 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from bench_suite import timed
+from binomial import lattice_nodes
+from rendering import new_figure, render_payoff_charts, render_tree
+from strategy import StrategyBook
+
+# Benchmark: headless binomial tree rendering and batched payoff charts
+# Usage: python bench_rendering.py [n_charts]
+#
+# The per-node version is the drawing loop A6Q11.py used to have (two
+# plot calls, a scatter and two texts per node), saved through the same
+# Agg canvas, so only the drawing differs.
+S0, K, r, q, sigma, T = 484, 480, 0.10, 0.03, 0.25, 2/12
+steps = [4, 10, 20, 40, 300, 1000, 3000]
+per_node_max_steps = 40  # the per-node version takes minutes beyond this
+
+
+def per_node_tree(S, V, path):
+    """The original one-artist-per-edge/node/label tree, on an Agg figure"""
+    n = len(S) - 1
+    fig = new_figure((10, 6))
+    ax = fig.add_subplot()
+    for i in range(n + 1):
+        for j in range(i + 1):
+            x, y = i, i - 2*j
+            if i < n:
+                ax.plot([x, x + 1], [y, y + 1], 'k-', alpha=0.2)
+                ax.plot([x, x + 1], [y, y - 1], 'k-', alpha=0.2)
+            color = 'lightgreen' if j == 0 else 'lightcoral' if j == i else 'lightyellow'
+            ax.scatter(x, y, s=300, c=color, edgecolors='black')
+            ax.text(x, y + 0.3, f'S={S[i][j]:.0f}', ha='center', fontweight='bold', fontsize=9)
+            ax.text(x, y - 0.4, f'P={V[i][j]:.1f}', ha='center', fontsize=8)
+    ax.set_title('American Put Option Tree')
+    ax.set_xlabel('Time Step')
+    ax.grid(alpha=0.3)
+    ax.set_ylim(-(n + 2), n + 2)
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def make_book(n_strategies, seed=0):
+    """Random strangles, spreads and straddles around 100"""
+    rng = np.random.default_rng(seed)
+    strategies = {}
+    for k in range(n_strategies):
+        K1, K2 = np.sort(rng.choice(np.arange(70, 131, 5), 2, replace=False)).tolist()
+        c, p = float(rng.uniform(1, 8)), float(rng.uniform(1, 8))
+        kind = k % 3
+        if kind == 0:
+            strategies[f'strangle {K1}/{K2} #{k}'] = [('put', K1, 1, 1, p), ('call', K2, 1, 1, c)]
+        elif kind == 1:
+            strategies[f'bull call {K1}/{K2} #{k}'] = [('call', K1, 1, 1, c + 2), ('call', K2, 1, -1, c)]
+        else:
+            strategies[f'straddle {K1} #{k}'] = [('put', K1, 1, 1, p), ('call', K1, 1, 1, c)]
+    return StrategyBook(strategies)
+
+
+if __name__ == "__main__":
+    n_charts = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    trees = {n: lattice_nodes(S0, K, r, sigma, T, n, q=q, option='put', american=True)
+             for n in steps}
+    new_figure()  # import matplotlib outside the timings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("=" * 72)
+        print("BINOMIAL TREE TO PNG (10x6 in, 100 dpi)")
+        print("=" * 72)
+        print(f"{'steps':>6} {'nodes':>9} {'per-node artists':>17} {'collections':>12} {'speedup':>8}")
+        for n, (S, V) in trees.items():
+            t_new = timed(lambda: render_tree(S, V, os.path.join(tmp, f'tree_{n}.png')), repeat=1)[1]
+            old, speedup = '-', '-'
+            if n <= per_node_max_steps:
+                t_old = timed(lambda: per_node_tree(S, V, os.path.join(tmp, f'old_{n}.png')), repeat=1)[1]
+                old, speedup = f'{t_old:.2f} s', f'{t_old/t_new:.1f}x'
+            print(f"{n:>6} {(n + 1)*(n + 2)//2:>9} {old:>17} {t_new:>10.2f} s {speedup:>8}")
+
+        n = steps[-1]
+        S, V = trees[n]
+        view = (n - 20, n, -20, 20)
+        for fmt in ('png', 'svg'):
+            path = os.path.join(tmp, f'tree_{n}_view.{fmt}')
+            t = timed(lambda: render_tree(S, V, path, view=view), repeat=1)[1]
+            print(f"{n} steps, view {view} as {fmt}: {t:.2f} s, {os.path.getsize(path)/1e3:.0f} KB")
+
+        print("\n" + "=" * 72)
+        print(f"BATCHED PAYOFF CHARTS: {n_charts} strategies, one process")
+        print("=" * 72)
+        book = make_book(n_charts)
+        S_T = np.linspace(50, 150, 401)
+        for fmt in ('png', 'svg'):
+            paths, t = timed(lambda: render_payoff_charts(book, S_T, os.path.join(tmp, fmt), fmt=fmt), repeat=1)
+            print(f"{fmt}: {len(paths)} charts in {t:.2f} s, {1e3*t/len(paths):.0f} ms/chart")
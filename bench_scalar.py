@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+
+from bench_black_scholes import bs_call, bs_put
+from bench_suite import timed
+from black_scholes import black_scholes, black_scholes_scalar
+
+# Benchmark: one contract at a time, as a quote-by-quote handler prices them
+# Usage: python bench_scalar.py
+n_contracts = 20000
+
+
+def make_quotes(n, seed=0):
+    """n random single contracts as tuples of Python floats (S, K, T, r, sigma, q)"""
+    rng = np.random.default_rng(seed)
+    cols = (rng.uniform(20, 60, n), rng.uniform(10, 90, n), rng.uniform(1/365, 5, n),
+            rng.uniform(0.0, 0.10, n), rng.uniform(0.05, 1.0, n), rng.uniform(0.0, 0.05, n))
+    return list(zip(*(c.tolist() for c in cols)))
+
+
+def per_contract(fn, quotes, repeat=3):
+    """Best-of-repeat time per contract in nanoseconds, and the results of the last pass"""
+    out, best = timed(lambda: [fn(*c) for c in quotes], repeat=repeat)
+    return best/len(quotes)*1e9, np.array(out, dtype=float)
+
+
+if __name__ == "__main__":
+    quotes = make_quotes(n_contracts)
+    S, K, T, r, sigma, q = (np.array(c) for c in zip(*quotes))
+    call, put = black_scholes(S, K, T, r, sigma, q)
+    no_q = [c[:5] for c in quotes]
+    call0, put0 = black_scholes(S, K, T, r, sigma)
+
+    # the cost of one Python loop iteration with a float multiply, to compare machines
+    t0 = time.perf_counter()
+    x = 1.0
+    for _ in range(10**6):
+        x = x*1.0000001
+    t_mul = (time.perf_counter() - t0)*1e3
+
+    print("=" * 72)
+    print(f"SINGLE-CONTRACT PRICING: call + put, {n_contracts:,} contracts one at a time")
+    print("=" * 72)
+    rows = [
+        ('scipy.stats norm.cdf', lambda *c: (bs_call(*c), bs_put(*c)), no_q[:2000], (call0, put0)),
+        ('black_scholes (arrays)', black_scholes, quotes[:5000], (call, put)),
+        ('black_scholes_scalar', black_scholes_scalar, quotes, (call, put)),
+    ]
+    print(f"{'path':<24} {'ns/contract':>12} {'max |diff| vs batch':>20}")
+    for label, fn, args, (c_ref, p_ref) in rows:
+        ns, out = per_contract(fn, args)
+        m = len(args)
+        err = max(np.max(np.abs(out[:, 0] - c_ref[:m])), np.max(np.abs(out[:, 1] - p_ref[:m])))
+        print(f"{label:<24} {ns:>12.0f} {err:>20.2e}")
+    print(f"\n(one Python loop iteration with a float multiply takes {t_mul:.0f} ns here)")
@@ -0,0 +1,43 @@
+import time
+
+import numpy as np
+
+from scenarios import BondScenarioEngine
+
+# Benchmark: scenario x bond P&L in taylor, full and hybrid modes
+# Usage: python bench_scenarios.py
+n_bonds, n_scenarios = 2000, 2000
+tenors = [1, 2, 5, 10, 30]
+tol = 1e-3      # hybrid: largest accepted Taylor error bound (price units, face 100)
+
+
+def make_book(schedule, seed=0):
+    """Semi-annual bonds with maturities on a monthly grid or irregular"""
+    rng = np.random.default_rng(seed)
+    maturity = rng.uniform(1, 30, n_bonds)
+    if schedule == 'monthly':
+        maturity = np.round(maturity*12)/12
+    return rng.uniform(0, 0.10, n_bonds), maturity, rng.uniform(0.01, 0.08, n_bonds)
+
+
+if __name__ == "__main__":
+    print("=" * 86)
+    print(f"SCENARIO REPRICING: {n_scenarios} key-rate scenarios x {n_bonds} bonds")
+    print("=" * 86)
+    print(f"{'schedule':>10} {'dates':>7} {'shock sd':>9} {'mode':>8} {'time (s)':>9} "
+          f"{'max |err|':>11} {'repriced':>9}")
+    rng = np.random.default_rng(1)
+    for schedule in ('monthly', 'irregular'):
+        coupon, maturity, ytm = make_book(schedule)
+        engine = BondScenarioEngine(coupon, maturity, ytm, tenors=tenors, frequency=2)
+        for sd in (0.0005, 0.002):
+            shifts = rng.normal(0, sd, (n_scenarios, len(tenors)))
+            exact = engine.full(shifts)
+            for mode in ('taylor', 'full', 'hybrid'):
+                t0 = time.perf_counter()
+                pnl = engine.pnl(shifts, mode, tol=tol)
+                t = time.perf_counter() - t0
+                repriced = {'taylor': 0.0, 'full': 1.0,
+                            'hybrid': (engine.error_bound(shifts) > tol).mean()}[mode]
+                print(f"{schedule:>10} {engine.dates.size:>7} {sd:>9.4f} {mode:>8} {t:>9.4f} "
+                      f"{np.max(np.abs(pnl - exact)):>11.2e} {repriced:>8.1%}")
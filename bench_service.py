@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Benchmark: load generator for service.py, sweeping the batching window
+# Usage: python bench_service.py [connections] [requests_per_connection]
+#
+# Each configuration starts a fresh service on a Unix socket, then opens
+# `connections` client connections that each keep one request in flight
+# (closed loop), so up to `connections` requests can share a batch.
+CONFIGS = [
+    ('unbatched', 0.0, 1),
+    ('window 0 us', 0.0, 4096),
+    ('window 200 us', 200.0, 4096),
+    ('window 1000 us', 1000.0, 4096),
+]
+
+
+def make_request(i, rng):
+    """A random Black-Scholes request"""
+    return {'id': i, 'method': 'black_scholes',
+            'params': {'S': float(rng.uniform(20, 60)), 'K': float(rng.uniform(20, 60)),
+                       'T': float(rng.uniform(1/52, 2)), 'r': 0.05, 'sigma': float(rng.uniform(0.1, 0.5))}}
+
+
+async def client(path, n_requests, seed, latencies):
+    """One connection sending n_requests back to back, recording each round trip"""
+    rng = np.random.default_rng(seed)
+    reader, writer = await asyncio.open_unix_connection(path)
+    for i in range(n_requests):
+        line = json.dumps(make_request(i, rng)).encode() + b'\n'
+        t0 = time.perf_counter()
+        writer.write(line)
+        reply = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - t0)
+        if 'error' in reply:
+            raise RuntimeError(reply['error'])
+    writer.close()
+
+
+async def query(path, method, params=None):
+    """Send one request and return its result"""
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(json.dumps({'id': 0, 'method': method, 'params': params or {}}).encode() + b'\n')
+    reply = json.loads(await reader.readline())
+    writer.close()
+    return reply['result']
+
+
+async def run_load(path, connections, n_requests):
+    """Warm up, then drive the service; returns client latencies, wall time and server stats"""
+    await asyncio.gather(*(client(path, 20, 10**6 + c, []) for c in range(connections)))
+    await query(path, 'stats', {'reset': True})
+    latencies = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(path, n_requests, c, latencies) for c in range(connections)))
+    wall = time.perf_counter() - t0
+    return np.array(latencies), wall, await query(path, 'stats')
+
+
+def start_service(path, window_us, max_batch):
+    """Start service.py on a Unix socket and wait until it accepts connections"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.Popen([sys.executable, os.path.join(here, 'service.py'), '--unix', path,
+                             '--window-us', str(window_us), '--max-batch', str(max_batch)],
+                            stdout=subprocess.DEVNULL)
+    for _ in range(500):
+        if os.path.exists(path):
+            return proc
+        time.sleep(0.01)
+    proc.kill()
+    raise RuntimeError("service did not start")
+
+
+if __name__ == "__main__":
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    n_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print("=" * 96)
+    print(f"PRICING SERVICE LOAD TEST: {connections} connections x {n_requests} Black-Scholes requests")
+    print("=" * 96)
+    print(f"{'config':<16} {'req/s':>9} {'mean batch':>11} {'client p50':>11} {'client p99':>11}"
+          f" {'server p50':>11} {'server p99':>11}")
+    for label, window_us, max_batch in CONFIGS:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'pricing.sock')
+            proc = start_service(path, window_us, max_batch)
+            try:
+                lat, wall, stats = asyncio.run(run_load(path, connections, n_requests))
+            finally:
+                proc.terminate()
+                proc.wait()
+        p50, p99 = np.percentile(lat, [50, 99])*1e6
+        print(f"{label:<16} {lat.size/wall:>9.0f} {stats['mean_batch']:>11.1f} {p50:>9.0f}us {p99:>9.0f}us"
+              f" {stats['p50_us']:>9.0f}us {stats['p99_us']:>9.0f}us")
+    print("\nclient latencies are round trips including JSON and the socket; server latencies run from")
+    print("request parse to priced result, so their difference is transport and event-loop queueing")
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+from strategy import StrategyBook
+
+# Benchmark: scanning random multi-leg structures, StrategyBook vs per-leg loop
+# Usage: python bench_strategy.py
+S, sigma, r, T = 32, 0.30, 0.05, 0.5
+grid = np.arange(15, 50, 1.0)
+strikes = np.arange(20, 45, 1.0)
+sizes = [10**2, 10**3, 10**4, 10**5]
+legs_per_strategy = 4
+
+
+def make_candidates(n, seed=0):
+    """n random structures of legs_per_strategy legs drawn from the strike ladder"""
+    rng = np.random.default_rng(seed)
+    m = n*legs_per_strategy
+    return (np.repeat(np.arange(n), legs_per_strategy), rng.random(m) < 0.5,
+            rng.choice(strikes, m), rng.choice([-2.0, -1.0, 1.0, 2.0], m))
+
+
+def loop_payoffs(index, is_call, K, qty, n):
+    """One np.maximum per leg, as the hand-written profit functions do"""
+    out = np.zeros((n, grid.size))
+    for k, c, strike, q in zip(index.tolist(), is_call.tolist(), K.tolist(), qty.tolist()):
+        out[k] += q*(np.maximum(grid - strike, 0) if c else np.maximum(strike - grid, 0))
+    return out
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print(f"STRATEGY SCAN: {legs_per_strategy}-leg structures over a {grid.size}-point grid")
+    print("=" * 70)
+    print(f"{'structures':>10} {'loop (s)':>10} {'book (s)':>10} {'speedup':>9} {'structs/s':>12} {'max |diff|':>12}")
+    for n in sizes:
+        index, is_call, K, qty = make_candidates(n)
+        t0 = time.perf_counter()
+        book = StrategyBook.from_arrays(index, is_call, K, T, qty)
+        profit = book.profit(grid, book.cost(S, r, sigma))
+        t_book = time.perf_counter() - t0
+        if n <= 10**4:
+            t0 = time.perf_counter()
+            loop = loop_payoffs(index, is_call, K, qty, n)
+            t_loop = time.perf_counter() - t0
+            err = np.max(np.abs(book.payoff(grid) - loop))
+            print(f"{n:>10} {t_loop:>10.4f} {t_book:>10.4f} {t_loop/t_book:>8.0f}x {n/t_book:>12.0f} {err:>12.2e}")
+        else:
+            print(f"{n:>10} {'skipped':>10} {t_book:>10.4f} {'-':>9} {n/t_book:>12.0f} {'-':>12}")
+
+    # Exact kink-point analysis vs a dense grid scan for max profit/loss
+    print(f"\n{'structures':>10} {'grid (s)':>10} {'exact (s)':>10} {'speedup':>9} {'grid max err':>13}")
+    fine = np.linspace(0, 2*strikes[-1], 10001)
+    for n in sizes[:3]:
+        index, is_call, K, qty = make_candidates(n)
+        book = StrategyBook.from_arrays(index, is_call, K, T, qty)
+        cost = book.cost(S, r, sigma)
+        t0 = time.perf_counter()
+        analysis = book.analyze(cost)
+        t_exact = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        grid_max = book.profit(fine, cost).max(axis=1)
+        t_grid = time.perf_counter() - t0
+        bounded = np.isfinite(analysis['max_profit'])
+        err = np.max(np.abs(grid_max - analysis['max_profit'])[bounded])
+        print(f"{n:>10} {t_grid:>10.4f} {t_exact:>10.4f} {t_grid/t_exact:>8.0f}x {err:>13.2e}")
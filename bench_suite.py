@@ -0,0 +1,360 @@
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+
+import numpy as np
+
+# Benchmark: golden-value regression and throughput check across the models
+# Usage: python bench_suite.py [--quick] [--out results.json] [--baseline results.json] [--threshold 0.25]
+#
+# Every golden value below is the answer of one of the A6Q scripts (or a
+# library call on the same inputs), checked against an independent
+# closed form when it was recorded: plain sums of discounted cashflows,
+# S*e^(rT), Black-Scholes through statistics.NormalDist, and the trees
+# rolled back node by node in pure Python. A result more than --rtol away
+# fails the run. CHECKS are behaviour checks (error handling, edge
+# cases) that fail the run the same way.
+#
+# Throughput is items per second (cashflows, bonds, contracts, chain rows,
+# tree steps or PDE space steps) at each input size, best of repeated
+# runs. With --baseline, a size whose throughput falls more than
+# --threshold below the baseline's fails the run. Timings depend on the
+# machine, so baselines are only comparable on the same one.
+GOLDEN = {
+    'A6Q1 PV of A': 986.4869358093922,
+    'A6Q1 PV of B': 1015.9201516869825,
+    'A6Q3 PV, quarterly compounding': 1978.686013943395,
+    'A6Q2 bond price': 868.0108422328516,
+    'A6Q2 Macaulay duration': 4.255974563427866,
+    'A6Q2 bond price at 10.8%': 875.4339139534211,
+    'A6Q4 forward price': 44.20683672302591,
+    'A6Q4 forward price after 6 months': 47.30719933692109,
+    'A6Q4 forward contract value': 2.9491561449590336,
+    'A6Q7 put from parity': 1.800996674983363,
+    'A6Q9 Black-Scholes call': 2.525146966700003,
+    'A6Q9 Black-Scholes put': 1.0458191275269098,
+    'A6Q10 European futures call, 2-step tree': 4.31546401384552,
+    'A6Q10 American futures call, 2-step tree': 4.402642169762441,
+    'A6Q11 American put, 4-step tree': 14.933233649496977,
+}
+
+
+def golden_values():
+    """The current value of every GOLDEN entry"""
+    import A6Q1
+    import A6Q2
+    import A6Q3
+    import A6Q4
+    import A6Q7
+    import A6Q9
+    import A6Q10
+    import A6Q11
+
+    pv = A6Q1.present_values()
+    bond = A6Q2.duration_estimate()
+    forward = A6Q4.forward_analysis()
+    options = A6Q9.option_prices()
+    futures = A6Q10.futures_call()
+    return {
+        'A6Q1 PV of A': pv['total_A'],
+        'A6Q1 PV of B': pv['total_B'],
+        'A6Q3 PV, quarterly compounding': A6Q3.present_value()['total'],
+        'A6Q2 bond price': bond['bond_value'],
+        'A6Q2 Macaulay duration': bond['bond_duration'],
+        'A6Q2 bond price at 10.8%': bond['bond_value1'],
+        'A6Q4 forward price': forward['F0'],
+        'A6Q4 forward price after 6 months': forward['F1'],
+        'A6Q4 forward contract value': forward['contract_value'],
+        'A6Q7 put from parity': A6Q7.european_put_call_parity(A6Q7.C, A6Q7.K, A6Q7.S, A6Q7.r, A6Q7.T)[0],
+        'A6Q9 Black-Scholes call': options['call_price'],
+        'A6Q9 Black-Scholes put': options['put_price'],
+        'A6Q10 European futures call, 2-step tree': futures['european_value'],
+        'A6Q10 American futures call, 2-step tree': futures['american_value'],
+        'A6Q11 American put, 4-step tree': A6Q11.american_put()['P'][0][0],
+    }
+
+
+def _raises(fn, exc):
+    try:
+        fn()
+    except exc:
+        return True
+    return False
+
+
+def check_bbsr_steps():
+    """BBS + Richardson rejects n < 2 and odd n, and stays accurate on even n"""
+    from binomial import binomial_price
+    from black_scholes import black_scholes
+
+    put = dict(S0=30, K=29, r=0.05, sigma=0.25, T=4/12, option='put', american=False, method='bbsr')
+    for n in (0, 1, 51, 101):
+        assert _raises(lambda: binomial_price(n=n, **put), ValueError), f"bbsr accepted n={n}"
+    exact = float(black_scholes(30, 29, 4/12, 0.05, 0.25)[1])
+    for n, tol in ((50, 1e-5), (100, 5e-5), (400, 5e-6)):
+        error = abs(binomial_price(n=n, **put) - exact)
+        assert error < tol, f"bbsr error {error:.1e} at n={n}"
+
+
+def check_strategy_legs_in_monte_carlo():
+    """StrategyBook legs with premiums price in monte_carlo_strategies, matching Black-Scholes"""
+    from monte_carlo import monte_carlo_strategies
+    from strategy import StrategyBook
+
+    S, r, sigma = 32, 0.05, 0.30
+    strategies = {
+        'Bull_Spread': [('call', 25, 0.5, 1, 7.8), ('call', 30, 0.5, -1, 4.2)],
+        'Butterfly_Put': [('put', 25, 1.0, 1, 0.6), ('put', 30, 1.0, -2, 1.9), ('put', 35, 1.0, 1, 4.3)],
+        'Strangle': [('call', 35, 0.5, 1, 1.5), ('put', 25, 0.5, 1, 0.3)],
+    }
+    book = StrategyBook(strategies)
+    exact = book.cost(S, r, sigma)
+    # under GBM the Black-Scholes control variate makes the estimate exact
+    mc = monte_carlo_strategies(strategies, S, r, sigma, n_paths=10**4, seed=0, control_variate=True)
+    for name, value in zip(book.names, exact.tolist()):
+        assert math.isclose(mc[name][0], value, rel_tol=1e-9), f"{name}: {mc[name][0]} != {value}"
+
+
+def check_arbitrage_wide_middle_strike():
+    """A box between outer strikes is found when the middle strike's quotes are too wide to trade"""
+    from arbitrage import KINDS, scan_chain
+    from black_scholes import black_scholes
+
+    K, T, r = np.array([90.0, 100.0, 110.0]), 0.5, 0.05
+    call, put = black_scholes(100.0, K, T, r, 0.25)
+    half = np.array([0.05, 1.0, 0.05])
+    # cheapen the 90 call and richen the 90 put: the 90/110 box is
+    # underpriced by 0.10 at the asks, while both adjacent boxes straddle
+    # the wide 100 quotes and show nothing
+    shift = np.array([0.15, 0.0, 0.0])
+    res = scan_chain(T, K, call - shift - half, call - shift + half, put + shift - half,
+                     put + shift + half, 99.75, 100.25, r=r)
+    found = [(KINDS[k], lo, hi, e) for k, lo, hi, e in
+             zip(res['kind'].tolist(), res['K_low'].tolist(), res['K_high'].tolist(), res['edge'].tolist())]
+    assert len(found) == 1 and found[0][:3] == ('box_buy', 90.0, 110.0), f"found {found}"
+    assert math.isclose(found[0][3], 0.10, rel_tol=1e-9), f"box edge {found[0][3]}"
+
+
+
+def check_arbitrage_fair_chain_with_rate_spread():
+    """A fair chain shows no arbitrage when borrowing costs more than lending"""
+    from arbitrage import KINDS, scan_chain
+    from black_scholes import black_scholes
+
+    K = np.arange(80.0, 121.0, 10.0)
+    call, put = black_scholes(100.0, K, 1.0, 0.05, 0.25)
+    # every trade is priced at zero spread, so only rounding can show up
+    res = scan_chain(1.0, K, call, call, put, put, 100.0, 100.0, r=0.05, rate_spread=0.02,
+                     min_edge=1e-9)
+    found = [(KINDS[k], lo, hi, e) for k, lo, hi, e in
+             zip(res['kind'].tolist(), res['K_low'].tolist(), res['K_high'].tolist(), res['edge'].tolist())]
+    assert not found, f"found {found}"
+
+# each check raises AssertionError with a message when it fails
+CHECKS = [check_bbsr_steps, check_strategy_legs_in_monte_carlo, check_arbitrage_wide_middle_strike,
+          check_arbitrage_fair_chain_with_rate_spread]
+
+
+def _pv(n, rng):
+    from cashflows import CashflowBook
+    from curve import YieldCurve
+
+    ids, t, amount = rng.integers(0, max(1, n//100), n), rng.uniform(0.01, 30, n), rng.uniform(10, 1000, n)
+    curve = YieldCurve.flat(4.33/100)
+    return lambda: CashflowBook(ids, t, amount, curve).total()
+
+
+def _bonds(n, rng):
+    from bonds import bond_analytics
+
+    coupon, maturity, ytm = rng.uniform(0.0, 0.10, n), rng.uniform(0.5, 30, n), rng.uniform(0.0, 0.12, n)
+    return lambda: bond_analytics(coupon, maturity, ytm, frequency=2)
+
+
+def _forwards(n, rng):
+    from forwards import ForwardBook
+
+    und, K, T = rng.integers(0, max(1, n//100), n), rng.uniform(50, 150, n), rng.uniform(0.01, 2, n)
+    spot = rng.uniform(50, 150, max(1, n//100))
+    return lambda: ForwardBook(und, K, T, 0.05, spot=spot).values()
+
+
+def _parity(n, rng):
+    from arbitrage import scan_chain
+    from black_scholes import black_scholes
+
+    n_exp = max(1, n//200)
+    T = np.repeat(np.linspace(1/52, 2, n_exp), -(-n//n_exp))[:n]
+    K = np.tile(np.linspace(50, 150, -(-n//n_exp)), n_exp)[:n]
+    call, put = black_scholes(100.0, K, T, 0.05, 0.25)
+    half = 0.01 + 0.02*rng.random(n)
+    return lambda: scan_chain(T, K, call - half, call + half, put - half, put + half, 100.0, r=0.05)
+
+
+def _black_scholes(n, rng):
+    from black_scholes import black_scholes
+
+    K, T = rng.uniform(16, 48, n), rng.uniform(1/52, 2.0, n)
+    return lambda: black_scholes(32.0, K, T, 0.05, 0.30)
+
+
+def _binomial(n, rng):
+    from binomial import binomial_price
+
+    return lambda: binomial_price(484, 480, 0.10, 0.25, 2/12, n, q=0.03)
+
+
+def _binomial_futures(n, rng):
+    from binomial import binomial_price
+
+    return lambda: binomial_price(60, 60, 0.08, 0.30, 0.5, n, option='call', futures=True)
+
+
+def _binomial_batch(n, rng):
+    from binomial import binomial_price_batch
+
+    K = rng.uniform(400, 560, n)
+    return lambda: binomial_price_batch(484, K, 0.10, 0.25, 2/12, 100, q=0.03)
+
+
+def _finite_difference(n, rng):
+    from finite_difference import fd_price
+
+    return lambda: fd_price(484, 480, 0.10, 0.25, 2/12, n, q=0.03)
+
+
+# model -> (what one item is, input sizes, quick-run sizes, setup(size, rng) returning the timed call)
+MODELS = {
+    'pv': ('cashflows', [10**3, 10**5, 10**6], [10**3, 10**5], _pv),
+    'bond_duration': ('bonds', [10**2, 10**3, 10**4], [10**2, 10**3], _bonds),
+    'forwards': ('contracts', [10**3, 10**5, 10**6], [10**3, 10**5], _forwards),
+    'parity': ('chain rows', [10**3, 10**5, 10**6], [10**3, 10**5], _parity),
+    'black_scholes': ('contracts', [10**3, 10**5, 10**6], [10**3, 10**5], _black_scholes),
+    'binomial_put': ('steps', [100, 1000, 5000], [100, 1000], _binomial),
+    'binomial_futures_call': ('steps', [100, 1000, 5000], [100, 1000], _binomial_futures),
+    'binomial_batch': ('contracts', [10, 1000, 10000], [10, 1000], _binomial_batch),
+    'finite_difference': ('space steps', [100, 400, 1600], [100, 400], _finite_difference),
+}
+
+
+def timed(fn, repeat=3, min_time=0.0, warmup=False):
+    """
+    Best wall time of fn() in seconds, over at least `repeat` calls and
+    min_time seconds of calls; warmup=True makes one untimed call first
+    (lazy imports, caches). Returns (result of the last call, seconds).
+    The bench_*.py scripts all time through this.
+    """
+    if warmup:
+        fn()
+    best, total, calls = float('inf'), 0.0, 0
+    while calls < repeat or total < min_time:
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = min(best, elapsed)
+        total += elapsed
+        calls += 1
+    return result, best
+
+
+def run(quick=False, models=None):
+    """Golden values and timings as one JSON-serializable dict"""
+    values = golden_values()
+    golden = {name: {'expected': expected, 'value': float(values[name])} for name, expected in GOLDEN.items()}
+    checks = {}
+    for check_fn in CHECKS:
+        try:
+            check_fn()
+            checks[check_fn.__name__] = None
+        except AssertionError as exc:
+            checks[check_fn.__name__] = str(exc)
+    timings = {}
+    for model, (unit, sizes, quick_sizes, setup) in MODELS.items():
+        if models and model not in models:
+            continue
+        timings[model] = {'unit': unit, 'sizes': {}}
+        for n in quick_sizes if quick else sizes:
+            seconds = timed(setup(n, np.random.default_rng(0)), min_time=0.2, warmup=True)[1]
+            timings[model]['sizes'][str(n)] = {'seconds': seconds, 'per_second': n/seconds}
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(),
+            'processor': platform.processor(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'golden': golden, 'checks': checks, 'timings': timings}
+
+
+def check(results, baseline=None, rtol=1e-9, threshold=0.25):
+    """Failure messages for golden values off by more than rtol and throughput below (1 - threshold) x baseline"""
+    failures = []
+    for name, g in results['golden'].items():
+        if not math.isclose(g['value'], g['expected'], rel_tol=rtol, abs_tol=1e-12):
+            failures.append(f"{name}: {g['value']!r} != golden {g['expected']!r}")
+    for name, failure in results.get('checks', {}).items():
+        if failure is not None:
+            failures.append(f"{name}: {failure}")
+    if baseline is not None:
+        for model, t in results['timings'].items():
+            for n, now in t['sizes'].items():
+                before = baseline.get('timings', {}).get(model, {}).get('sizes', {}).get(n)
+                if before and now['per_second'] < (1 - threshold)*before['per_second']:
+                    failures.append(f"{model} at {n} {t['unit']}: {now['per_second']:.4g}/s, "
+                                    f"baseline {before['per_second']:.4g}/s "
+                                    f"({now['per_second']/before['per_second'] - 1:+.0%})")
+    return failures
+
+
+def report(results, baseline=None):
+    """Print the golden-value errors and the throughput table"""
+    print("=" * 78)
+    print("GOLDEN VALUES")
+    print("=" * 78)
+    for name, g in results['golden'].items():
+        error = abs(g['value'] - g['expected'])/abs(g['expected'])
+        print(f"{name:<44} {g['value']:>18.10f} {error:>9.1e}")
+
+    print("\n" + "=" * 78)
+    print("CHECKS")
+    print("=" * 78)
+    for name, failure in results['checks'].items():
+        print(f"{name:<44} {'ok' if failure is None else 'FAILED'}")
+
+    print("\n" + "=" * 78)
+    print("THROUGHPUT (items/s, best of repeated runs)")
+    print("=" * 78)
+    print(f"{'model':<22} {'size':>9} {'unit':<12} {'ms':>10} {'items/s':>12} {'vs baseline':>12}")
+    for model, t in results['timings'].items():
+        for n, now in t['sizes'].items():
+            before = (baseline or {}).get('timings', {}).get(model, {}).get('sizes', {}).get(n)
+            change = f"{now['per_second']/before['per_second'] - 1:+.0%}" if before else '-'
+            print(f"{model:<22} {int(n):>9} {t['unit']:<12} {now['seconds']*1e3:>10.3f} "
+                  f"{now['per_second']:>12.4g} {change:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Golden-value and throughput regression check")
+    parser.add_argument('--quick', action='store_true', help="only the smaller input sizes")
+    parser.add_argument('--models', nargs='+', choices=list(MODELS), help="time only these models")
+    parser.add_argument('--out', help="write the results to this JSON file")
+    parser.add_argument('--baseline', help="compare throughput with this earlier results file")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="fail when throughput drops by more than this fraction")
+    parser.add_argument('--rtol', type=float, default=1e-9, help="relative tolerance for golden values")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    results = run(args.quick, args.models)
+    report(results, baseline)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=1)
+    failures = check(results, baseline, args.rtol, args.threshold)
+    if failures:
+        print(f"\nFAILED ({len(failures)}):")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nall golden values within tolerance, all checks pass" + (", no throughput regressions" if baseline else ""))
@@ -0,0 +1,275 @@
+import math
+
+import numpy as np
+
+from black_scholes import black_scholes
+
+
+def crr_parameters(r, sigma, T, n, q=0.0, futures=False):
+    """
+    Cox-Ross-Rubinstein tree parameters for an n-step tree
+
+    For a futures underlying the risk-neutral drift is zero, so
+    p = (1-d)/(u-d) as in A6Q10; otherwise p = (e^((r-q)dt)-d)/(u-d) with
+    dividend yield q as in A6Q11.
+
+    Returns (u, d, p, disc) where disc = e^(-r*dt) is the one-step discount.
+    """
+    dt = T/n
+    u = math.exp(sigma*math.sqrt(dt))
+    d = 1/u
+    growth = 1.0 if futures else math.exp((r - q)*dt)
+    p = (growth - d)/(u - d)
+    return u, d, p, math.exp(-r*dt)
+
+
+def _payoff(option, K):
+    """Return the exercise value function for a 'call' or 'put'"""
+    if option == 'call':
+        return lambda S: np.maximum(S - K, 0.0)
+    if option == 'put':
+        return lambda S: np.maximum(K - S, 0.0)
+    raise ValueError(f"option must be 'call' or 'put', got {option!r}")
+
+
+def _price_powers(S0, u, n):
+    """S0*u^m for m = -n..n; node (i, j) sits at m = i - 2j"""
+    return S0*u**np.arange(-n, n + 1, dtype=float)
+
+
+def _step_view(values, n, i):
+    """Values at step i, j = 0..i, from an array over m = -n..n (a strided view)"""
+    return values[n + i::-2][:i + 1]
+
+
+def binomial_price(S0, K, r, sigma, T, n, q=0.0, option='put', american=True, futures=False,
+                   method='crr'):
+    """
+    Price a European or American option on a CRR binomial tree
+
+    Backward induction runs in place on one rolling 1-D array of option
+    values (plus one scratch array), so memory is O(n) and each step is a
+    vectorized continuation and, for American options, exercise update.
+    Exercise values at each step are strided views of one precomputed array
+    of payoffs at S0*u^m.
+
+    q is the dividend yield; futures=True treats S0 as a futures price.
+    method selects the induction:
+      'crr'  - plain tree, max(continuation, exercise) at every node
+      'bbs'  - binomial Black-Scholes: the last step uses the analytic
+               European value, which removes the odd/even oscillation
+      'bbsr' - BBS with two-point Richardson extrapolation,
+               (n*BBS(n) - m*BBS(m))/(n - m) with m = n/2, for roughly
+               second-order convergence; n must be even (odd n pairs
+               trees of different parity, whose errors do not cancel)
+    """
+    if method == 'bbsr':
+        if n < 2 or n % 2:
+            raise ValueError(f"method='bbsr' needs an even n >= 2, got {n}")
+        m = n//2
+        fine = binomial_price(S0, K, r, sigma, T, n, q, option, american, futures, 'bbs')
+        coarse = binomial_price(S0, K, r, sigma, T, m, q, option, american, futures, 'bbs')
+        return (n*fine - m*coarse)/(n - m)
+    if method not in ('crr', 'bbs'):
+        raise ValueError(f"method must be 'crr', 'bbs' or 'bbsr', got {method!r}")
+    return _rolling_induction(S0, K, r, sigma, T, n, q, option, american, futures,
+                              bbs=method == 'bbs')[0][0]
+
+
+def _rolling_induction(S0, K, r, sigma, T, n, q, option, american, futures, buffers=None,
+                       bbs=False):
+    """
+    Backward induction shared by binomial_price and binomial_greeks
+
+    buffers may be a (V, tmp) pair of float arrays with at least n+1
+    elements, reused across calls. With bbs=True the values at step n-1
+    are analytic Black-Scholes prices over the last dt. Returns the option
+    values at steps 0, 1 and 2 (the last two as small copies, or None when
+    n is too small).
+    """
+    u, d, p, disc = crr_parameters(r, sigma, T, n, q, futures)
+    powers = _price_powers(S0, u, n)
+    ex = _payoff(option, K)(powers)
+
+    if buffers is None:
+        buffers = np.empty(n + 1), np.empty(n + 1)
+    V, tmp = buffers
+    start = n
+    V[:n + 1] = _step_view(ex, n, n)
+    if bbs:
+        start = n - 1
+        call, put = black_scholes(_step_view(powers, n, start), K, T/n, r, sigma,
+                                  q=r if futures else q)
+        V[:n] = call if option == 'call' else put
+        if american:
+            np.maximum(V[:n], _step_view(ex, n, start), out=V[:n])
+    early = [V[:1], None, None]
+    if 0 < start <= 2:
+        early[start] = V[:start + 1].copy()
+    pu, pd = disc*p, disc*(1 - p)
+    for i in range(start - 1, -1, -1):
+        cur, t = V[:i + 1], tmp[:i + 1]
+        np.multiply(V[1:i + 2], pd, out=t)
+        cur *= pu
+        cur += t
+        if american:
+            np.maximum(cur, _step_view(ex, n, i), out=cur)
+        if 0 < i <= 2:
+            early[i] = cur.copy()
+    return early
+
+
+def binomial_greeks(S0, K, r, sigma, T, n, q=0.0, option='put', american=True, futures=False,
+                    vega_rho=False, bump=1e-4):
+    """
+    Price and Greeks from one CRR induction
+
+    delta, gamma and theta are read from the nodes at steps 1 and 2 of the
+    same induction that produces the price, so they cost nothing extra:
+
+        delta = (V_u - V_d) / (S_u - S_d)
+        gamma = [(V_uu - V_ud)/(S_uu - S0) - (V_ud - V_dd)/(S0 - S_dd)] / ((S_uu - S_dd)/2)
+        theta = (V_ud - V_0) / (2 dt)
+
+    With vega_rho=True, vega and rho come from one forward bump each of
+    sigma and r (by `bump`), re-run on the same n and the same value
+    buffers, so the full set costs three tree runs. Requires n >= 2.
+
+    Returns a dict with 'price', 'delta', 'gamma', 'theta' and optionally
+    'vega' and 'rho'.
+    """
+    if n < 2:
+        raise ValueError("tree Greeks need at least n = 2 steps")
+    u = crr_parameters(r, sigma, T, n, q, futures)[0]
+    d = 1/u
+    buffers = np.empty(n + 1), np.empty(n + 1)
+    V0, V1, V2 = _rolling_induction(S0, K, r, sigma, T, n, q, option, american, futures, buffers)
+    price = float(V0[0])
+
+    S_u, S_d = S0*u, S0*d
+    S_uu, S_dd = S0*u*u, S0*d*d
+    out = {
+        'price': price,
+        'delta': (V1[0] - V1[1])/(S_u - S_d),
+        'gamma': ((V2[0] - V2[1])/(S_uu - S0) - (V2[1] - V2[2])/(S0 - S_dd))/(0.5*(S_uu - S_dd)),
+        'theta': (V2[1] - price)/(2*T/n),
+    }
+    if vega_rho:
+        up_sigma = _rolling_induction(S0, K, r, sigma + bump, T, n, q, option, american, futures, buffers)
+        out['vega'] = (up_sigma[0][0] - price)/bump
+        up_r = _rolling_induction(S0, K, r + bump, sigma, T, n, q, option, american, futures, buffers)
+        out['rho'] = (up_r[0][0] - price)/bump
+    return out
+
+
+def lattice_nodes(S0, K, r, sigma, T, n, q=0.0, option='put', american=True, futures=False):
+    """
+    Full tree of underlying prices and option values, for display
+
+    Same induction as binomial_price but every step is kept, so this is
+    O(n^2) and only meant for small trees that are printed or plotted.
+
+    Returns (S, V) as lists of arrays where S[i][j], V[i][j] is node (i, j).
+    """
+    u, d, p, disc = crr_parameters(r, sigma, T, n, q, futures)
+    exercise = _payoff(option, K)
+    powers = _price_powers(S0, u, n)
+
+    S = [_step_view(powers, n, i).copy() for i in range(n + 1)]
+    V = [None]*(n + 1)
+    V[n] = exercise(S[n])
+    for i in range(n - 1, -1, -1):
+        V[i] = disc*(p*V[i + 1][:-1] + (1 - p)*V[i + 1][1:])
+        if american:
+            V[i] = np.maximum(V[i], exercise(S[i]))
+    return S, V
+
+
+def binomial_price_batch(S0, K, r, sigma, T, n, q=0.0, option='put', american=True, futures=False,
+                         chunk=256):
+    """
+    Price many contracts together on n-step CRR trees
+
+    S0, K, r, sigma, T and q are broadcast to one 1-D array of contracts and
+    the induction runs on 2-D (nodes x contracts) arrays, so the Python loop
+    is paid once per time step for a whole chunk of contracts rather than
+    once per contract. Nodes are the leading axis so every step's slice is
+    one contiguous block; contracts are processed `chunk` at a time to keep
+    the working set in cache. Returns an array of prices, one per contract.
+    """
+    S0, K, r, sigma, T, q = (np.ravel(a).astype(float) for a in
+                             np.broadcast_arrays(S0, K, r, sigma, T, q))
+    prices = np.empty(S0.size)
+    for a in range(0, S0.size, chunk):
+        c = slice(a, a + chunk)
+        prices[c] = _batch_induction(S0[c], K[c], r[c], sigma[c], T[c], q[c], n,
+                                     option, american, futures)
+    return prices
+
+
+def _batch_induction(S0, K, r, sigma, T, q, n, option, american, futures):
+    """Backward induction for one chunk of contracts (1-D parameter arrays)"""
+    dt = T/n
+    u = np.exp(sigma*np.sqrt(dt))
+    d = 1/u
+    growth = 1.0 if futures else np.exp((r - q)*dt)
+    p = (growth - d)/(u - d)
+    disc = np.exp(-r*dt)
+    pu, pd = disc*p, disc*(1 - p)
+
+    # Exercise values at S0*u^m for m = n..-n; node (i, j) sits on row
+    # n - i + 2j, so each step reads a contiguous block of one parity half.
+    ex = _payoff(option, K)(S0*u**np.arange(n, -n - 1, -1, dtype=float)[:, None])
+    ex_by_parity = (ex[0::2], ex[1::2])
+
+    V = ex_by_parity[0][:n + 1].copy()
+    tmp = np.empty_like(V)
+    for i in range(n - 1, -1, -1):
+        cur, t = V[:i + 1], tmp[:i + 1]
+        np.multiply(V[1:i + 2], pd, out=t)
+        cur *= pu
+        cur += t
+        if american:
+            # continuation values are never negative, so comparing with the
+            # precomputed max(payoff, 0) is the same as max(cont, exercise)
+            s = (n - i)//2
+            np.maximum(cur, ex_by_parity[(n - i) % 2][s:s + i + 1], out=cur)
+    return V[0]
+
+
+def exercise_boundary(S0, K, r, sigma, T, n, q=0.0, option='put', futures=False):
+    """
+    Price an American option and record its early-exercise boundary
+
+    The boundary is read off the same induction as the price: at each step
+    the critical price is the highest exercised node for a put (lowest for
+    a call). This replaces a second scan over the tree as in A6Q10.
+
+    Returns (price, tau, S_star) where tau[i] is the time to expiry at step
+    i = 0..n-1 and S_star[i] the critical price there (NaN if no node at
+    that step is exercised).
+    """
+    u, d, p, disc = crr_parameters(r, sigma, T, n, q, futures)
+    powers = _price_powers(S0, u, n)
+    ex = _payoff(option, K)(powers)
+
+    V = _step_view(ex, n, n).copy()
+    tmp = np.empty_like(V)
+    S_star = np.full(n, np.nan)
+    pu, pd = disc*p, disc*(1 - p)
+    for i in range(n - 1, -1, -1):
+        cur, t = V[:i + 1], tmp[:i + 1]
+        np.multiply(V[1:i + 2], pd, out=t)
+        cur *= pu
+        cur += t
+        ex_i = _step_view(ex, n, i)
+        # exercised nodes form one run: the low-price end for a put, the
+        # high-price end for a call (continuation is never negative, so
+        # ex > cont also implies a positive payoff)
+        hit = ex_i > cur
+        j = int(np.argmax(hit)) if option == 'put' else i - int(np.argmax(hit[::-1]))
+        if hit[j]:
+            S_star[i] = _step_view(powers, n, i)[j]
+        np.maximum(cur, ex_i, out=cur)
+    tau = T - T/n*np.arange(n)
+    return float(V[0]), tau, S_star
@@ -0,0 +1,140 @@
+from math import erfc, exp, log, sqrt
+
+import numpy as np
+
+_SQRT1_2 = sqrt(0.5)
+
+
+def ndtr(x):
+    """
+    Standard normal CDF (scipy.special.ndtr)
+
+    scipy.special takes longer to import than NumPy itself, so it is only
+    imported on the first call, which rebinds this name to the ufunc.
+    """
+    global ndtr
+    from scipy.special import ndtr
+    return ndtr(x)
+
+
+def d1_d2(S, K, T, r, sigma, q=0.0):
+    """Calculate d1 and d2 for the Black-Scholes formula (broadcasts over arrays)"""
+    sig_sqrt_T = sigma*np.sqrt(T)
+    d1 = (np.log(S/K) + (r - q + 0.5*sigma**2)*T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    return d1, d2
+
+
+def black_scholes(S, K, T, r, sigma, q=0.0):
+    """
+    Price European calls and puts together using Black-Scholes
+
+    S, K, T, r, sigma and the dividend yield q may be scalars or NumPy arrays
+    of any broadcastable shapes (q = r gives Black's model for futures).
+    d1/d2 and the discounted strike are computed once and shared between the
+    call and the put. N(-d1)/N(-d2) are evaluated directly rather than as
+    1 - N(d) so deep out-of-the-money puts keep their precision.
+
+    Returns (call_price, put_price).
+    """
+    S = np.asarray(S, dtype=float)
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float)
+    d1, d2 = d1_d2(S, K, T, r, sigma, q)
+    K_disc = K*np.exp(-r*T)
+    S_disc = S*np.exp(-q*T) if np.any(q) else S
+
+    call_price = S_disc*ndtr(d1) - K_disc*ndtr(d2)
+    put_price = K_disc*ndtr(-d2) - S_disc*ndtr(-d1)
+    return call_price, put_price
+
+
+def norm_cdf(x):
+    """Standard normal CDF of one Python float, via math.erfc (accurate in both tails)"""
+    return 0.5*erfc(-x*_SQRT1_2)
+
+
+def black_scholes_scalar(S, K, T, r, sigma, q=0.0):
+    """
+    European call and put for one contract, with plain floats
+
+    The scalar fast path for quote-by-quote pricing: only math-module
+    calls, so no array creation or ufunc dispatch, with d1/d2 and both
+    discounted terms shared by the call and the put. N(-d) is evaluated
+    directly as in black_scholes(), which it matches to rounding.
+
+    Returns (call_price, put_price) as floats.
+    """
+    sig_sqrt_T = sigma*sqrt(T)
+    d1 = (log(S/K) + (r - q)*T)/sig_sqrt_T + 0.5*sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    K_disc = K*exp(-r*T)
+    S_disc = S*exp(-q*T) if q else S
+    d1 *= _SQRT1_2
+    d2 *= _SQRT1_2
+    call_price = 0.5*(S_disc*erfc(-d1) - K_disc*erfc(-d2))
+    put_price = 0.5*(K_disc*erfc(d2) - S_disc*erfc(d1))
+    return call_price, put_price
+
+
+def black_scholes_call(S, K, T, r, sigma):
+    """Calculate European call option price using Black-Scholes formula"""
+    d1, d2 = d1_d2(S, K, T, r, sigma)
+    return S*ndtr(d1) - K*np.exp(-r*np.asarray(T, dtype=float))*ndtr(d2)
+
+
+def black_scholes_put(S, K, T, r, sigma):
+    """Calculate European put option price using Black-Scholes formula"""
+    d1, d2 = d1_d2(S, K, T, r, sigma)
+    return K*np.exp(-r*np.asarray(T, dtype=float))*ndtr(-d2) - S*ndtr(-d1)
+
+
+GREEKS = ('delta', 'gamma', 'vega', 'theta', 'rho')
+
+
+def black_scholes_greeks(S, K, T, r, sigma, is_call=True, greeks=None):
+    """
+    Black-Scholes price and analytic Greeks in one pass
+
+    d1/d2, N(d1)/N(d2), the normal density at d1, the discount factor and
+    sqrt(T) are computed once and shared by every output. is_call may be an
+    array, so a book mixing calls and puts is priced in one call. greeks is
+    an iterable of names from GREEKS (default: all of them); only the
+    requested arrays are computed and returned, to save memory on large
+    books. Vega and rho are per unit change (not per 1%), theta per year.
+
+    Returns a dict with 'price' and one entry per requested Greek.
+    """
+    greeks = GREEKS if greeks is None else tuple(greeks)
+    unknown = set(greeks) - set(GREEKS)
+    if unknown:
+        raise ValueError(f"unknown Greeks {sorted(unknown)}; choose from {GREEKS}")
+
+    S = np.asarray(S, dtype=float)
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float)
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma*sqrt_T
+    d1 = (np.log(S/K) + (r + 0.5*sigma**2)*T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    K_disc = K*np.exp(-r*T)
+
+    # theta = +1 for calls, -1 for puts: price = theta*(S N(theta d1) - K e^(-rT) N(theta d2))
+    theta = np.where(is_call, 1.0, -1.0)
+    Nd1 = ndtr(theta*d1)
+    Nd2 = ndtr(theta*d2)
+    out = {'price': theta*(S*Nd1 - K_disc*Nd2)}
+
+    if 'delta' in greeks:
+        out['delta'] = theta*Nd1
+    if {'gamma', 'vega', 'theta'} & set(greeks):
+        S_pdf = S*np.exp(-0.5*d1*d1)/np.sqrt(2*np.pi)
+        if 'gamma' in greeks:
+            out['gamma'] = S_pdf/(S*S*sig_sqrt_T)
+        if 'vega' in greeks:
+            out['vega'] = S_pdf*sqrt_T
+        if 'theta' in greeks:
+            out['theta'] = -S_pdf*sigma/(2*sqrt_T) - theta*r*K_disc*Nd2
+    if 'rho' in greeks:
+        out['rho'] = theta*K_disc*T*Nd2
+    return out
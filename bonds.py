@@ -0,0 +1,141 @@
+import numpy as np
+
+COMPOUNDING = ('continuous', 'periodic')
+
+
+def cashflow_matrix(coupon, maturity, frequency=1, face=100.0):
+    """
+    Explicit (bonds x periods) payment-time and cashflow matrices
+
+    Coupons of coupon*face/frequency are paid every 1/frequency years
+    counting back from maturity, with the face added to the last one;
+    shorter bonds are padded with zero cashflows (at time 0), so every
+    sum over a row is an ordinary dense reduction. Arguments broadcast.
+    Used where each cashflow is discounted separately, e.g. off a
+    YieldCurve or under the curve shifts of scenarios.py.
+
+    Returns (t, cf, freq) where freq is the per-bond frequency column.
+    """
+    coupon, maturity, frequency, face = (np.ravel(a).astype(float) for a in
+                                         np.broadcast_arrays(coupon, maturity, frequency, face))
+    periods = np.ceil(maturity*frequency - 1e-9).astype(int)
+    width = max(int(periods.max()), 1) if periods.size else 1
+    # column k is the k-th payment from the end: t = maturity - k/frequency
+    k = np.arange(width)
+    t = maturity[:, None] - k/frequency[:, None]
+    live = k < periods[:, None]
+    cf = np.where(live, (coupon*face/frequency)[:, None], 0.0)
+    cf[:, 0] += face
+    return np.where(live, t, 0.0), cf, frequency[:, None]
+
+
+def _moments(y, coupon, maturity, frequency, face, compounding, second=True):
+    """
+    Row sums of PV, PV*t and (optionally) PV*t^2 over each bond's cashflows
+
+    Walks back from maturity one coupon period at a time: consecutive
+    discount factors differ by the constant ratio e^(y/f) (continuous) or
+    1 + y/f (periodic), so each step is one multiply over all bonds
+    instead of an exp per cashflow, and no (bonds x periods) array is
+    materialized.
+    """
+    if compounding == 'continuous':
+        D = np.exp(-y*maturity)
+        g = np.exp(y/frequency)
+    elif compounding == 'periodic':
+        D = np.exp(-frequency*maturity*np.log1p(y/frequency))
+        g = 1 + y/frequency
+    else:
+        raise ValueError(f"compounding must be one of {COMPOUNDING}, got {compounding!r}")
+    periods = np.ceil(maturity*frequency - 1e-9)
+    cpn = coupon*face/frequency
+    s0 = D*(cpn + face)
+    s1 = s0*maturity
+    s2 = s1*maturity if second else None
+    for k in range(1, int(periods.max()) if periods.size else 0):
+        D *= g
+        t = maturity - k/frequency
+        pv = np.where(k < periods, cpn*D, 0.0)
+        s0 += pv
+        pv *= t
+        s1 += pv
+        if second:
+            pv *= t
+            s2 += pv
+    return s0, s1, s2
+
+
+def _columns(n, *arrays):
+    """Broadcast scalars/arrays to flat float columns of length n"""
+    return (np.broadcast_to(np.ravel(np.asarray(a, dtype=float)), (n,)).copy() for a in arrays)
+
+
+def bond_analytics(coupon, maturity, ytm, frequency=1, face=100.0, compounding='continuous'):
+    """
+    Price and risk measures for an array of bonds in one pass
+
+    coupon is the annual coupon rate and ytm the yield, compounded
+    continuously (as in A6Q2) or once per coupon period. Coupons are paid
+    every 1/frequency years counting back from maturity. Price and every
+    measure come from the same three discounted-cashflow sums, built in
+    one backward walk over coupon dates. Prices are for a settlement date
+    on a coupon date (no accrued interest).
+
+    Returns a dict of arrays: 'price', 'macaulay' and 'modified' duration
+    (years), 'convexity' (years^2) and 'dv01' (price change for a one
+    basis point fall in yield).
+    """
+    n = np.broadcast(coupon, maturity, ytm, frequency, face).size
+    coupon, maturity, y, freq, face = _columns(n, coupon, maturity, ytm, frequency, face)
+    price, s1, s2 = _moments(y, coupon, maturity, freq, face, compounding)
+    macaulay = s1/price
+    if compounding == 'continuous':
+        modified = macaulay
+        convexity = s2/price
+    else:
+        growth = 1 + y/freq
+        modified = macaulay/growth
+        convexity = (s2 + s1/freq)/(price*growth**2)
+    return {'price': price, 'macaulay': macaulay, 'modified': modified,
+            'convexity': convexity, 'dv01': modified*price*1e-4}
+
+
+def bond_price(coupon, maturity, ytm, frequency=1, face=100.0, compounding='continuous'):
+    """Price of an array of bonds (see bond_analytics)"""
+    n = np.broadcast(coupon, maturity, ytm, frequency, face).size
+    coupon, maturity, y, freq, face = _columns(n, coupon, maturity, ytm, frequency, face)
+    return _moments(y, coupon, maturity, freq, face, compounding, second=False)[0]
+
+
+def bond_yield(price, coupon, maturity, frequency=1, face=100.0, compounding='continuous',
+               tol=1e-12, max_iter=50):
+    """
+    Yield to maturity for an array of bond prices
+
+    Newton's method runs on all bonds at once, starting from the textbook
+    approximation (C + (F - P)/n)/((F + P)/2), and bonds drop out of the
+    iteration as they converge. Price is convex and decreasing in yield,
+    so Newton converges for any positive price; bonds that have not
+    converged after max_iter steps, or whose price is not positive, get NaN.
+    """
+    n = np.broadcast(price, coupon, maturity, frequency, face).size
+    price, coupon, maturity, freq, face = _columns(n, price, coupon, maturity, frequency, face)
+
+    y = np.full(n, np.nan)
+    idx = np.flatnonzero(price > 0)
+    x = ((coupon*face + (face - price)/maturity)/((face + price)/2))[idx]
+    p_, c_, m_, f_, F_ = price[idx], coupon[idx], maturity[idx], freq[idx], face[idx]
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+        value, slope, _ = _moments(x, c_, m_, f_, F_, compounding, second=False)
+        if compounding == 'periodic':
+            slope /= 1 + x/f_
+        step = (value - p_)/slope
+        x += step
+        done = np.abs(step) < tol*np.maximum(np.abs(x), 1.0)
+        if done.any():
+            y[idx[done]] = x[done]
+            keep = ~done
+            idx, x, p_, c_, m_, f_, F_ = idx[keep], x[keep], p_[keep], c_[keep], m_[keep], f_[keep], F_[keep]
+    return y
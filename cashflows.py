@@ -0,0 +1,98 @@
+import numpy as np
+
+
+class CashflowBook:
+    """
+    Columnar store of (instrument, time, amount) cashflows priced off a curve
+
+    instrument holds any hashable labels (one per cashflow), time the
+    payment times in years and amount the cashflows; curve is anything
+    with a vectorized df(t), such as a YieldCurve. Discounting is one
+    vectorized curve lookup and multiply over the time column, and
+    per-instrument PVs are a bincount over integer instrument codes.
+    Everything stays float64.
+
+    update() changes a few cashflows and append() adds new ones; both
+    adjust the stored PVs by the difference instead of revaluing the whole
+    book. Cashflow positions never move, so an index into the book stays
+    valid across appends.
+    """
+
+    def __init__(self, instrument, time, amount, curve):
+        self.ids, codes = np.unique(np.asarray(instrument), return_inverse=True)
+        self.codes = codes.ravel()
+        self.time = np.array(time, dtype=float).ravel()
+        self.amount = np.array(amount, dtype=float).ravel()
+        if not (self.codes.size == self.time.size == self.amount.size):
+            raise ValueError("instrument, time and amount must have the same length")
+        self.set_curve(curve)
+
+    def set_curve(self, curve):
+        """Switch to a new curve and revalue every cashflow"""
+        self.curve = curve
+        self.df = np.array(curve.df(self.time), dtype=float)
+        self.cashflow_pv = self.amount*self.df
+        self._pv = np.bincount(self.codes, self.cashflow_pv, minlength=self.ids.size)
+
+    def pv(self, instrument=None):
+        """PV per instrument (aligned with self.ids), or of one instrument"""
+        if instrument is None:
+            return self._pv.copy()
+        k = np.searchsorted(self.ids, instrument)
+        if k >= self.ids.size or self.ids[k] != instrument:
+            raise KeyError(instrument)
+        return float(self._pv[k])
+
+    def total(self):
+        """PV of the whole book"""
+        return float(self._pv.sum())
+
+    def update(self, index, amount=None, time=None):
+        """
+        Change the amount and/or time of the cashflows at positions index
+
+        Only the changed cashflows are rediscounted, and the affected
+        instrument PVs are adjusted by the change in their PV.
+        """
+        index = np.atleast_1d(np.asarray(index, dtype=int))
+        if amount is not None:
+            self.amount[index] = amount
+        if time is not None:
+            self.time[index] = time
+            self.df[index] = self.curve.df(self.time[index])
+        index = np.unique(index)
+        new = self.amount[index]*self.df[index]
+        np.add.at(self._pv, self.codes[index], new - self.cashflow_pv[index])
+        self.cashflow_pv[index] = new
+
+    def append(self, instrument, time, amount):
+        """
+        Add cashflows at the end of the book
+
+        Only the new cashflows are discounted and added to their instrument
+        PVs. Instruments not seen before are merged into the sorted ids, and
+        the existing codes and PVs are remapped to match. The columns are
+        copied to grow them, so add cashflows in batches rather than one
+        at a time.
+        """
+        instrument = np.ravel(np.asarray(instrument))
+        time = np.array(time, dtype=float).ravel()
+        amount = np.array(amount, dtype=float).ravel()
+        if not (instrument.size == time.size == amount.size):
+            raise ValueError("instrument, time and amount must have the same length")
+        ids = np.union1d(self.ids, instrument)
+        if ids.size != self.ids.size:
+            moved = np.searchsorted(ids, self.ids)
+            self.codes = moved[self.codes]
+            pv = np.zeros(ids.size)
+            pv[moved] = self._pv
+            self.ids, self._pv = ids, pv
+        codes = np.searchsorted(self.ids, instrument)
+        df = np.array(self.curve.df(time), dtype=float)
+        cashflow_pv = amount*df
+        self._pv += np.bincount(codes, cashflow_pv, minlength=self.ids.size)
+        self.codes = np.concatenate([self.codes, codes])
+        self.time = np.concatenate([self.time, time])
+        self.amount = np.concatenate([self.amount, amount])
+        self.df = np.concatenate([self.df, df])
+        self.cashflow_pv = np.concatenate([self.cashflow_pv, cashflow_pv])
@@ -0,0 +1,200 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+INTERPOLATIONS = ('log_linear', 'monotone_cubic')
+_FAR = 1e6      # years; the flat-forward tail is exact out to here
+
+
+def _log_df(rates, t, compounding):
+    """ln of the discount factor for zero rates quoted with the given compounding"""
+    if compounding == 'continuous':
+        return -rates*t
+    if compounding == 'simple':
+        return -np.log1p(rates*t)
+    if isinstance(compounding, int) and compounding > 0:
+        return -compounding*t*np.log1p(rates/compounding)
+    raise ValueError(f"compounding must be 'continuous', 'simple' or a positive int, got {compounding!r}")
+
+
+def _rates_from_log_df(log_df, t, compounding):
+    """Inverse of _log_df"""
+    if compounding == 'continuous':
+        return -log_df/t
+    if compounding == 'simple':
+        return np.expm1(-log_df)/t
+    if isinstance(compounding, int) and compounding > 0:
+        return compounding*np.expm1(-log_df/(compounding*t))
+    raise ValueError(f"compounding must be 'continuous', 'simple' or a positive int, got {compounding!r}")
+
+
+class ArrayCache:
+    """
+    LRU of computed arrays keyed by the contents of their input arrays
+
+    Used by YieldCurve.df() and VolSurface.vol() so that repricing on the
+    same grid does not redo the work. An entry for n input arrays of one
+    shape is charged n + 1 times their bytes (the keys and the result);
+    least recently used entries are evicted to keep the total within
+    max_bytes, and 0 disables the cache. Results are returned read-only
+    since every hit hands out the same array.
+    """
+
+    def __init__(self, max_bytes=2**26):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = self.misses = 0
+
+    def clear(self):
+        """Drop every entry (the hit and miss counts are kept)"""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def get(self, compute, *arrays):
+        """
+        compute() for the given input arrays, from the cache when seen before
+
+        Scalar inputs and entries larger than max_bytes bypass the cache,
+        and their result is returned as computed (writeable).
+        """
+        size = (len(arrays) + 1)*arrays[0].nbytes
+        if arrays[0].ndim == 0 or size > self.max_bytes:
+            return compute()
+        key = (arrays[0].shape,) + tuple(a.tobytes() for a in arrays)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+        self.misses += 1
+        out = compute()
+        out.setflags(write=False)
+        self._entries[key] = out, size
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, old_size) = self._entries.popitem(last=False)
+            self.nbytes -= old_size
+        return out
+
+
+class YieldCurve:
+    """
+    Discount curve interpolated in log discount factor
+
+    times and zero_rates give the curve nodes, with the rates quoted under
+    compounding: 'continuous', 'simple' or n periods per year (an int).
+    Nodes are stored as ln DF, with DF(0) = 1, and interpolated either
+    log-linearly (piecewise flat forward rates) or with a monotone cubic
+    (PCHIP), which keeps DF decreasing wherever the nodes are. Beyond the
+    last node the last forward rate is held flat.
+
+    df() caches its result per distinct time grid in self.cache, an
+    ArrayCache of up to cache_bytes (0 disables it), so repricing on the
+    same cashflow dates does not redo the interpolation and exp.
+    """
+
+    def __init__(self, times, zero_rates, compounding='continuous', interpolation='log_linear',
+                 cache_bytes=2**26):
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"interpolation must be one of {INTERPOLATIONS}, got {interpolation!r}")
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        rates = np.broadcast_to(np.asarray(zero_rates, dtype=float), times.shape)
+        if np.any(times <= 0) or np.any(np.diff(times) <= 0):
+            raise ValueError("times must be positive and strictly increasing")
+        self.compounding = compounding
+        self.interpolation = interpolation
+        self.times = np.concatenate([[0.0], times])
+        self.log_dfs = np.concatenate([[0.0], _log_df(rates, times, compounding)])
+        self._pchip = None
+        if interpolation == 'monotone_cubic':
+            from scipy.interpolate import PchipInterpolator
+            self._pchip = PchipInterpolator(self.times, self.log_dfs)
+        # flat forward beyond the last node, as one far-out extra node so
+        # that np.interp extrapolates without a separate masked pass
+        slope = (self.log_dfs[-1] - self.log_dfs[-2])/(self.times[-1] - self.times[-2])
+        self._interp_t = np.append(self.times, _FAR)
+        self._interp_y = np.append(self.log_dfs, self.log_dfs[-1] + slope*(_FAR - self.times[-1]))
+        self.cache = ArrayCache(cache_bytes)
+
+    @classmethod
+    def flat(cls, rate, compounding='continuous', **kwargs):
+        """
+        A curve with the same zero rate at every maturity
+
+        Continuous and n-period compounding give flat forward rates, so one
+        node suffices; a flat simple rate does not, and is not supported.
+        """
+        if compounding == 'simple':
+            raise ValueError("a flat simple rate is not a flat-forward curve; give the nodes explicitly")
+        return cls([1.0], [rate], compounding, **kwargs)
+
+    @classmethod
+    def bootstrap(cls, maturities, par_rates, frequency=1, **kwargs):
+        """
+        Curve that reprices par instruments
+
+        Maturities up to one coupon period are deposits quoted with simple
+        interest; longer ones are par bonds/swaps paying par_rate/frequency
+        every 1/frequency years. Each node is solved in turn by Newton's
+        method on its ln DF, with coupon dates between nodes on the
+        log-linear curve, so the result is a log-linear curve.
+        """
+        maturities = np.asarray(maturities, dtype=float)
+        par_rates = np.asarray(par_rates, dtype=float)
+        tau = 1.0/frequency
+        times, log_dfs = [0.0], [0.0]
+        for T, c in zip(maturities.tolist(), par_rates.tolist()):
+            if T <= tau + 1e-12:
+                x = -math.log1p(c*T)
+            else:
+                # coupon dates before maturity, counted back from T
+                coupons = np.arange(T - tau, 1e-12, -tau)[::-1]
+                known = coupons[coupons <= times[-1]]
+                fixed = np.exp(np.interp(known, times, log_dfs)).sum()
+                between = coupons[coupons > times[-1]]
+                w = (between - times[-1])/(T - times[-1])
+                x = log_dfs[-1] - c*(T - times[-1])
+                for _ in range(50):
+                    d = np.exp(log_dfs[-1]*(1 - w) + x*w)
+                    df_T = math.exp(x)
+                    f = c*tau*(fixed + d.sum()) + (1 + c*tau)*df_T - 1.0
+                    step = f/(c*tau*np.dot(d, w) + (1 + c*tau)*df_T)
+                    x -= step
+                    if abs(step) < 1e-15:
+                        break
+            times.append(T)
+            log_dfs.append(x)
+        times = np.array(times[1:])
+        return cls(times, -np.array(log_dfs[1:])/times, 'continuous', **kwargs)
+
+    def _log_df_at(self, t):
+        """Interpolated ln DF at an array of times"""
+        out = np.interp(t, self._interp_t, self._interp_y)
+        if self._pchip is not None:
+            inside = t < self.times[-1]
+            out[inside] = self._pchip(t[inside])
+        return out
+
+    def df(self, t):
+        """
+        Discount factors at times t (scalar or array of any shape)
+
+        Array results come from self.cache and are read-only; copy them
+        before modifying.
+        """
+        t = np.asarray(t, dtype=float)
+        return self.cache.get(lambda: np.exp(self._log_df_at(np.atleast_1d(t).ravel())).reshape(t.shape), t)
+
+    def zero_rate(self, t, compounding='continuous'):
+        """Zero rates at times t (> 0) under the given compounding"""
+        t = np.asarray(t, dtype=float)
+        return _rates_from_log_df(self._log_df_at(np.atleast_1d(t)).reshape(t.shape), t, compounding)
+
+    def forward_rate(self, t1, t2):
+        """Continuously compounded forward rate between t1 and t2 > t1"""
+        t1, t2 = np.asarray(t1, dtype=float), np.asarray(t2, dtype=float)
+        l1 = self._log_df_at(np.atleast_1d(t1)).reshape(t1.shape)
+        l2 = self._log_df_at(np.atleast_1d(t2)).reshape(t2.shape)
+        return (l1 - l2)/(t2 - t1)
@@ -0,0 +1,178 @@
+import math
+
+import numpy as np
+
+from binomial import _payoff
+
+
+def _ul_factor(sub, diag, sup):
+    """
+    UL factorization of a tridiagonal matrix, A = U L
+
+    U is unit upper bidiagonal (superdiagonal u) and L lower bidiagonal
+    (diagonal l, subdiagonal sub). Eliminating from the last row up means
+    row i of L only mixes V_i and V_(i-1), which is what lets the
+    early-exercise projection run from the first row. Returns the banded
+    (2 x n, Fortran-ordered) forms of U and L for LAPACK's dtbtrs.
+    """
+    n = diag.size
+    u = np.zeros(n)
+    l = np.empty(n)
+    l[-1] = diag[-1]
+    for i in range(n - 2, -1, -1):
+        u[i] = sup[i]/l[i + 1]
+        l[i] = diag[i] - u[i]*sub[i + 1]
+    U = np.asfortranarray([np.concatenate([[0.0], u[:-1]]), np.ones(n)])
+    L = np.asfortranarray([l, np.concatenate([sub[1:], [0.0]])])
+    return U, L
+
+
+def _solve_projected(U, L, sub, d, g, exercised):
+    """
+    Brennan-Schwartz solve of A V = d subject to V >= g
+
+    The exercise region is taken to be the first rows of the grid (a
+    put's low spots; a call's grid is passed in reverse). After U y = d,
+    every row below the boundary holds V = g, so the first continuation
+    row k is the first one whose value given V_(k-1) = g_(k-1) beats
+    exercise, and the rest is one lower-bidiagonal solve. exercised is
+    the part of that value that does not depend on y, sub_i*g_(i-1)/l_i.
+    If the solve dips below g again (no single boundary) the rows are
+    projected one at a time instead.
+    """
+    from scipy.linalg.lapack import dtbtrs
+
+    y = dtbtrs(U, d, uplo='U', diag='U')[0]
+    l = L[0]
+    z = y/l
+    z -= exercised
+    cont = z > g
+    k = int(cont.argmax())
+    if not cont[k]:
+        return g.copy()
+    V = np.empty_like(g)
+    V[:k] = g[:k]
+    if k:
+        y[k] -= sub[k]*g[k - 1]
+    V[k:] = dtbtrs(L[:, k:], y[k:], uplo='L')[0]
+    if np.any(V[k:] < g[k:]):
+        V[0] = max(y[0]/l[0], g[0])
+        for i in range(1, V.size):
+            V[i] = max((y[i] - sub[i]*V[i - 1])/l[i], g[i])
+    return V
+
+
+def fd_price_grid(K, r, sigma, T, n=400, q=0.0, option='put', american=True, futures=False,
+                  n_time=None, width=5.0, x_range=0.0, rannacher=2):
+    """
+    Option values against spot from one Crank-Nicolson solve
+
+    The Black-Scholes PDE is solved in x = ln(S/K) on n uniform space
+    intervals spanning x_range + width standard deviations (sigma*sqrt(T))
+    either side of the strike, which sits on a grid node. Time runs
+    backward from expiry in n_time Crank-Nicolson steps (default n/2),
+    the first `rannacher` of which are replaced by two implicit Euler
+    half-steps each, so the payoff kink does not leave oscillations.
+    American exercise is imposed in every step by a Brennan-Schwartz
+    tridiagonal solve (see _solve_projected). The outer nodes hold the
+    asymptotic values: zero, or the discounted forward intrinsic value
+    (at least the exercise value when American).
+
+    q is the dividend yield; futures=True treats spot as a futures price
+    (zero drift), as in binomial_price.
+
+    Returns a dict with 'S' (the grid spots) and 'price' (the option
+    values there).
+    """
+    if n < 4 or n % 2:
+        raise ValueError("n must be an even number of space steps, at least 4")
+    n_time = n//2 if n_time is None else n_time
+    if n_time < rannacher:
+        raise ValueError("n_time must be at least the number of Rannacher steps")
+    exercise = _payoff(option, 1.0)
+    q = r if futures else q
+    half_width = x_range + width*sigma*math.sqrt(T)
+    x = np.linspace(-half_width, half_width, n + 1)
+    h = x[1] - x[0]
+    if option == 'call':
+        # exercise happens at high spots: run the solve on the reversed grid
+        x, h = x[::-1].copy(), -h
+    S = np.exp(x)
+    g = exercise(S)
+
+    # L V = 0.5 sigma^2 V_xx + (r - q - 0.5 sigma^2) V_x - r V on the interior
+    a = 0.5*sigma*sigma/(h*h)
+    b = (r - q - 0.5*sigma*sigma)/(2*h)
+    lo, mid, hi = a - b, -2*a - r, a + b
+
+    def system(theta, dt):
+        sub = np.full(n + 1, -theta*dt*lo)
+        diag = np.full(n + 1, 1 - theta*dt*mid)
+        sup = np.full(n + 1, -theta*dt*hi)
+        sub[0] = sup[0] = sub[-1] = sup[-1] = 0.0
+        diag[0] = diag[-1] = 1.0
+        U, L = _ul_factor(sub, diag, sup)
+        exercised = np.zeros(n + 1)
+        exercised[1:] = sub[1:]*g[:-1]/L[0, 1:]
+        return sub, U, L, exercised
+
+    def edges(tau):
+        far = S[[0, -1]]
+        forward = far*math.exp(-q*tau) - math.exp(-r*tau)
+        value = np.maximum(forward if option == 'call' else -forward, 0.0)
+        return np.maximum(value, exercise(far)) if american else value
+
+    dt = T/n_time
+    steps = [(1.0, dt/2)]*(2*rannacher) + [(0.5, dt)]*(n_time - rannacher)
+    systems = {step: system(*step) for step in set(steps)}
+    V = g.copy()
+    tau = 0.0
+    for theta, step in steps:
+        sub, U, L, exercised = systems[theta, step]
+        tau += step
+        d = V.copy()
+        if theta < 1:
+            explicit = (1 - theta)*step
+            d[1:-1] += explicit*(lo*V[:-2] + mid*V[1:-1] + hi*V[2:])
+        d[[0, -1]] = edges(tau)
+        if american:
+            V = _solve_projected(U, L, sub, d, g, exercised)
+        else:
+            from scipy.linalg.lapack import dtbtrs
+
+            V = dtbtrs(L, dtbtrs(U, d, uplo='U', diag='U')[0], uplo='L')[0]
+    if option == 'call':
+        S, V = S[::-1], V[::-1]
+    return {'S': K*S, 'price': K*V}
+
+
+def fd_price(S0, K, r, sigma, T, n=400, q=0.0, option='put', american=True, futures=False,
+             n_time=None, width=5.0, rannacher=2):
+    """
+    Price options at spots S0 and strikes K (broadcast) from one PDE grid
+
+    Vanilla prices are homogeneous in (S, K), V(S, K) = K v(S/K), so a
+    single solve of fd_price_grid for a unit strike prices a whole
+    strike ladder (or spot ladder, or both): each contract is read off at
+    its log-moneyness by cubic interpolation between grid nodes and
+    scaled by its strike. The grid is widened to cover the furthest
+    contract.
+
+    Returns an array of prices with the broadcast shape of S0 and K.
+    """
+    S0, K = np.broadcast_arrays(np.asarray(S0, dtype=float), np.asarray(K, dtype=float))
+    moneyness = np.log(S0/K)
+    x_range = float(np.abs(moneyness).max()) if moneyness.size else 0.0
+    grid = fd_price_grid(1.0, r, sigma, T, n, q, option, american, futures, n_time, width,
+                         x_range, rannacher)
+    x, v = np.log(grid['S']), grid['price']
+    # four-point Lagrange interpolation on the uniform grid
+    h = x[1] - x[0]
+    t = (moneyness - x[0])/h
+    i = np.clip(np.floor(t).astype(int), 1, n - 2)
+    t -= i
+    w0 = -t*(t - 1)*(t - 2)/6
+    w1 = (t + 1)*(t - 1)*(t - 2)/2
+    w2 = -(t + 1)*t*(t - 2)/2
+    w3 = (t + 1)*t*(t - 1)/6
+    return K*(w0*v[i - 1] + w1*v[i] + w2*v[i + 1] + w3*v[i + 2])
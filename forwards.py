@@ -0,0 +1,88 @@
+import numpy as np
+
+
+class ForwardBook:
+    """
+    Mark-to-market of many forward contracts, updated tick by tick
+
+    underlying holds a label per contract, K the delivery prices, T the
+    times to delivery, r the risk-free rate and q the continuous yield on
+    the underlying (dividend or convenience yield; negative for a storage
+    cost), so the cost of carry is r - q. All broadcast against each other.
+    quantity is the number of units held long (negative for short).
+
+    A long forward is worth S*e^(-qT) - K*e^(-rT), so both discounted
+    terms are precomputed per contract and a price tick on one underlying
+    only rescales that underlying's contracts, which are stored as one
+    contiguous slice. Each underlying's totals are kept as Python floats,
+    so its MTM and the book total update in O(1).
+    """
+
+    def __init__(self, underlying, K, T, r, q=0.0, quantity=1.0, spot=None):
+        labels, codes = np.unique(np.asarray(underlying), return_inverse=True)
+        codes = codes.ravel()
+        n = codes.size
+        K, T, r, q, quantity = (np.broadcast_to(np.ravel(np.asarray(a, dtype=float)), (n,))
+                                for a in (K, T, r, q, quantity))
+        # contracts sorted by underlying, so each one is a slice
+        order = np.argsort(codes, kind='stable')
+        self._order = order
+        self._inverse = np.empty(n, dtype=int)
+        self._inverse[order] = np.arange(n)
+        self.underlyings = labels.tolist()
+        self._index = {u: k for k, u in enumerate(self.underlyings)}
+        bounds = np.searchsorted(codes[order], np.arange(labels.size + 1))
+        self._slices = [slice(a, b) for a, b in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+
+        self.K, self.T, self.r, self.q, self.quantity = (a[order].copy() for a in (K, T, r, q, quantity))
+        self.spot = [np.nan]*labels.size
+        self._value = np.zeros(n)
+        self._reprice()
+        if spot is not None:
+            for u, s in (spot.items() if isinstance(spot, dict) else zip(self.underlyings, spot)):
+                self.tick(u, s)
+
+    def _reprice(self):
+        """Recompute the discounted terms and every contract's value"""
+        self._S_coef = self.quantity*np.exp(-self.q*self.T)
+        self._K_pv = self.quantity*self.K*np.exp(-self.r*self.T)
+        self._sum_S_coef = [float(self._S_coef[s].sum()) for s in self._slices]
+        self._sum_K_pv = [float(self._K_pv[s].sum()) for s in self._slices]
+        self._u_value = [0.0]*len(self._slices)
+        for k, s in enumerate(self._slices):
+            if not np.isnan(self.spot[k]):
+                np.multiply(self._S_coef[s], self.spot[k], out=self._value[s])
+                self._value[s] -= self._K_pv[s]
+                self._u_value[k] = self.spot[k]*self._sum_S_coef[k] - self._sum_K_pv[k]
+        self._total = sum(self._u_value)
+
+    def tick(self, underlying, price):
+        """New price for one underlying; revalues only its contracts"""
+        k = self._index[underlying]
+        s = self._slices[k]
+        self.spot[k] = price
+        np.multiply(self._S_coef[s], price, out=self._value[s])
+        self._value[s] -= self._K_pv[s]
+        new = price*self._sum_S_coef[k] - self._sum_K_pv[k]
+        self._total += new - self._u_value[k]
+        self._u_value[k] = new
+
+    def advance(self, dt):
+        """Let dt years pass: shorten every maturity and reprice at the last spots"""
+        self.T = np.maximum(self.T - dt, 0.0)
+        self._reprice()
+
+    def value(self, underlying=None):
+        """MTM of the book, or of the contracts on one underlying"""
+        if underlying is None:
+            return self._total
+        return self._u_value[self._index[underlying]]
+
+    def values(self):
+        """MTM per contract, in the order the contracts were given"""
+        return self._value[self._inverse]
+
+    def forward_prices(self):
+        """Forward price S*e^((r - q)T) per contract, in the order given"""
+        spot = np.repeat(self.spot, [s.stop - s.start for s in self._slices])
+        return (spot*np.exp((self.r - self.q)*self.T))[self._inverse]
@@ -0,0 +1,119 @@
+import numpy as np
+
+import black_scholes
+
+# Status codes returned by implied_vol(..., full_output=True)
+CONVERGED = 0
+BELOW_INTRINSIC = 1     # price <= no-arbitrage lower bound (vol would be <= 0)
+ABOVE_MAX = 2           # price >= upper bound S (call) or K*e^(-rT) (put)
+NOT_CONVERGED = 3
+
+_SQRT_2PI = np.sqrt(2*np.pi)
+
+
+def _initial_guess(otm_price, S, X, T):
+    """
+    Corrado-Miller approximation on the out-of-the-money price, falling back
+    to the Manaster-Koehler point sqrt(2|ln(S/X)|/T) where it is undefined
+    """
+    half_gap = 0.5*(S - X)
+    # C-M is stated for calls; the OTM put maps to a call by parity
+    call = np.where(S >= X, otm_price + S - X, otm_price)
+    a = call - half_gap
+    disc = a*a - (S - X)**2/np.pi
+    cm = _SQRT_2PI/((S + X)*np.sqrt(T))*(a + np.sqrt(np.maximum(disc, 0.0)))
+    mk = np.sqrt(2*np.abs(np.log(S/X))/T)
+    guess = np.where((disc > 0) & (cm > 0), cm, mk)
+    return np.clip(np.nan_to_num(guess, nan=0.3), 1e-3, 3.0)
+
+
+def implied_vol(price, S, K, T, r, is_call=True, tol=1e-10, max_iter=50, full_output=False):
+    """
+    Implied Black-Scholes volatility for a whole chain of option quotes
+
+    All arguments broadcast against each other. Every quote is first mapped
+    by put-call parity to its out-of-the-money side, which is better
+    conditioned, then solved with Halley steps on the log price (using vega
+    and vomma) from a Corrado-Miller start. Each element keeps a [lo, hi] bracket and falls
+    back to bisection when a step leaves it, and only elements that have
+    not yet converged are carried into the next iteration.
+
+    Quotes outside the no-arbitrage bounds do not raise: their volatility is
+    NaN. With full_output=True, returns (sigma, status) where status holds
+    CONVERGED, BELOW_INTRINSIC, ABOVE_MAX or NOT_CONVERGED per quote.
+    """
+    price, S, K, T, r, is_call = np.broadcast_arrays(price, S, K, T, r, is_call)
+    shape = price.shape
+    price, S, K, T, r = (np.ravel(a).astype(float) for a in (price, S, K, T, r))
+    is_call = np.ravel(is_call).astype(bool)
+    X = K*np.exp(-r*T)
+
+    # Bounds on the quoted side: call in (max(S-X, 0), S), put in (max(X-S, 0), X)
+    lower = np.where(is_call, np.maximum(S - X, 0.0), np.maximum(X - S, 0.0))
+    upper = np.where(is_call, S, X)
+    status = np.full(price.size, NOT_CONVERGED, dtype=np.int8)
+    status[price <= lower] = BELOW_INTRINSIC
+    status[price >= upper] = ABOVE_MAX
+    sigma = np.full(price.size, np.nan)
+
+    # theta = +1 prices the OTM side as a call, -1 as a put
+    theta = np.where(S < X, 1.0, -1.0)
+    otm_call = theta > 0
+    otm_price = np.where(is_call == otm_call, price, price - np.where(is_call, S - X, X - S))
+
+    idx = np.flatnonzero(status == NOT_CONVERGED)
+    target, S_, X_, T_, th = otm_price[idx], S[idx], X[idx], T[idx], theta[idx]
+    sqrt_T = np.sqrt(T_)
+    log_SX = np.log(S_/X_)
+    vega_scale = S_*sqrt_T/_SQRT_2PI
+    step_tol = np.sqrt(tol)
+    log_target = np.log(target)
+    vol = _initial_guess(target, S_, X_, T_)
+    lo = np.zeros_like(vol)
+    hi = np.full_like(vol, 10.0)
+
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+        sig_sqrt_T = vol*sqrt_T
+        d1 = log_SX/sig_sqrt_T
+        d1 += 0.5*sig_sqrt_T
+        d2 = d1 - sig_sqrt_T
+        otm = th*(S_*black_scholes.ndtr(th*d1) - X_*black_scholes.ndtr(th*d2))
+        vega = vega_scale*np.exp(-0.5*d1*d1)
+
+        # Halley on g = ln(price) - ln(target), which stays well scaled for
+        # far out-of-the-money quotes where the raw price is nearly flat;
+        # g'' / g' = d1*d2/vol - g'
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            g = np.log(otm) - log_target
+            g1 = vega/otm
+            newton = g/g1
+            step = newton/(1 - 0.5*newton*(d1*d2/vol - g1))
+
+        # price is increasing in vol, so the residual's sign tightens the bracket
+        over = g > 0
+        np.copyto(hi, vol, where=over)
+        np.copyto(lo, vol, where=~over)
+
+        new = vol - step
+        bad = ~((new >= lo) & (new <= hi))
+        new[bad] = 0.5*(lo[bad] + hi[bad])
+
+        # Near the root the Newton step is the error estimate, and a Halley
+        # step from within sqrt(tol) lands well inside tol, so accept it
+        # now rather than paying another iteration to confirm
+        done = ~bad & (np.abs(newton) < step_tol*np.maximum(vol, 1.0))
+        vol = new
+        if done.any():
+            sigma[idx[done]] = vol[done]
+            status[idx[done]] = CONVERGED
+            keep = ~done
+            idx, log_target, S_, X_, T_, th = idx[keep], log_target[keep], S_[keep], X_[keep], T_[keep], th[keep]
+            sqrt_T, log_SX, vega_scale = sqrt_T[keep], log_SX[keep], vega_scale[keep]
+            vol, lo, hi = vol[keep], lo[keep], hi[keep]
+
+    sigma, status = sigma.reshape(shape), status.reshape(shape)
+    if full_output:
+        return sigma, status
+    return sigma
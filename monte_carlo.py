@@ -0,0 +1,145 @@
+import math
+
+import numpy as np
+
+from black_scholes import black_scholes
+
+
+def gbm_sampler(S, T, r, q, sigma, z, rng):
+    """Terminal prices under geometric Brownian motion (the Black-Scholes model)"""
+    return S*np.exp((r - q - 0.5*sigma**2)*T + sigma*math.sqrt(T)*z)
+
+
+def merton_sampler(lam, mu_j, sigma_j):
+    """
+    Terminal-price sampler for Merton's jump diffusion
+
+    Jumps arrive at rate lam with log sizes N(mu_j, sigma_j^2); the drift
+    is compensated so the discounted price stays a martingale. The
+    diffusion is driven by the engine's normals z (so antithetic and
+    control variates still apply) and the jumps by rng.
+    """
+    k = math.exp(mu_j + 0.5*sigma_j**2) - 1
+
+    def sampler(S, T, r, q, sigma, z, rng):
+        jumps = rng.poisson(lam*T, z.shape)
+        log_jump = mu_j*jumps + sigma_j*np.sqrt(jumps)*rng.standard_normal(z.shape)
+        return S*np.exp((r - q - lam*k - 0.5*sigma**2)*T + sigma*math.sqrt(T)*z + log_jump)
+    return sampler
+
+
+def _leg_payoff(option, K, S_T):
+    """Terminal payoff of one call or put leg"""
+    if option == 'call':
+        return np.maximum(S_T - K, 0.0)
+    if option == 'put':
+        return np.maximum(K - S_T, 0.0)
+    raise ValueError(f"option must be 'call' or 'put', got {option!r}")
+
+
+def _strategy_payoffs(strategies, terminal, r):
+    """
+    Discounted payoff per path of each strategy
+
+    terminal maps each expiry to its simulated prices; a leg (option, K, T)
+    shared by several strategies is evaluated once.
+    """
+    legs = {}
+    out = {}
+    for name, strategy in strategies.items():
+        total = 0.0
+        for option, K, T, qty, *_ in strategy:
+            key = (option, K, T)
+            if key not in legs:
+                legs[key] = math.exp(-r*T)*_leg_payoff(option, K, terminal[T])
+            total = total + qty*legs[key]
+        out[name] = total
+    return out
+
+
+def monte_carlo_strategies(strategies, S, r, sigma, q=0.0, n_paths=10**6, seed=None,
+                           antithetic=True, control_variate=False, chunk=2**20, sampler=None):
+    """
+    Monte Carlo value of option strategies from one shared set of paths
+
+    strategies maps a name to a list of legs (option, K, T, quantity),
+    option being 'call' or 'put' and quantity negative for short legs, e.g.
+    {'Bull_Spread': [('call', 25, 0.5, 1), ('call', 30, 0.5, -1)]}; a fifth
+    leg field (the premium, as StrategyBook takes) is ignored. Every
+    strategy is valued from the same standard normals, one terminal price
+    per path and expiry, drawn chunk paths at a time so memory stays
+    bounded; only running sums are kept between chunks. seed makes the
+    result reproducible.
+
+    sampler(S, T, r, q, sigma, z, rng) turns normals into terminal prices
+    (default gbm_sampler; see merton_sampler). With antithetic=True each
+    normal is paired with its negative and the pair average is one sample.
+    With control_variate=True the same strategy under Black-Scholes,
+    driven by the same normals, is the control, with its closed-form price
+    as the known mean; under the default GBM sampler this reproduces the
+    Black-Scholes price exactly.
+
+    Returns {name: (price, standard_error)}.
+    """
+    sampler = sampler or gbm_sampler
+    rng = np.random.default_rng(seed)
+    expiries = sorted({leg[2] for strategy in strategies.values() for leg in strategy})
+    # per strategy: sum Y, sum Y^2 and, for the control X, sum X, X^2, XY
+    sums = {name: np.zeros(5) for name in strategies}
+    n_samples = 0
+
+    remaining = n_paths
+    while remaining > 0:
+        m = min(chunk, remaining)
+        remaining -= m
+        if antithetic:
+            half = rng.standard_normal((m + 1)//2)
+            z = np.concatenate([half, -half])
+        else:
+            z = rng.standard_normal(m)
+
+        Y = _strategy_payoffs(strategies, {T: sampler(S, T, r, q, sigma, z, rng) for T in expiries}, r)
+        if control_variate:
+            if sampler is gbm_sampler:
+                X = Y
+            else:
+                X = _strategy_payoffs(strategies, {T: gbm_sampler(S, T, r, q, sigma, z, rng)
+                                                   for T in expiries}, r)
+        for name, s in sums.items():
+            y = np.broadcast_to(Y[name], z.shape)
+            if antithetic:
+                y = 0.5*(y[:half.size] + y[half.size:])
+            s[0] += y.sum()
+            s[1] += np.dot(y, y)
+            if control_variate:
+                x = np.broadcast_to(X[name], z.shape)
+                if antithetic:
+                    x = 0.5*(x[:half.size] + x[half.size:])
+                s[2] += x.sum()
+                s[3] += np.dot(x, x)
+                s[4] += np.dot(x, y)
+        n_samples += half.size if antithetic else m
+
+    if control_variate:
+        bs_call, bs_put = {}, {}
+        for T in expiries:
+            Ks = sorted({leg[1] for strategy in strategies.values() for leg in strategy if leg[2] == T})
+            c, p = black_scholes(S, np.array(Ks, dtype=float), T, r, sigma, q)
+            bs_call.update({(K, T): v for K, v in zip(Ks, c)})
+            bs_put.update({(K, T): v for K, v in zip(Ks, p)})
+
+    out = {}
+    for name, (sy, syy, sx, sxx, sxy) in sums.items():
+        mean_y = sy/n_samples
+        var_y = max(syy/n_samples - mean_y**2, 0.0)
+        if control_variate:
+            mu_x = sum(qty*(bs_call if option == 'call' else bs_put)[(K, T)]
+                       for option, K, T, qty, *_ in strategies[name])
+            mean_x = sx/n_samples
+            var_x = sxx/n_samples - mean_x**2
+            cov = sxy/n_samples - mean_x*mean_y
+            beta = cov/var_x if var_x > 0 else 0.0
+            mean_y -= beta*(mean_x - mu_x)
+            var_y = max(var_y - beta*cov, 0.0)
+        out[name] = (float(mean_y), math.sqrt(var_y/n_samples))
+    return out
@@ -0,0 +1,118 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from binomial import binomial_price_batch
+from black_scholes import black_scholes
+
+
+def _attach(name, shape):
+    """Attach to a shared-memory block and view it as a float64 array"""
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=float, buffer=shm.buf)
+
+
+def _run_shard(func, in_name, in_shape, out_name, out_shape, start, stop, kwargs):
+    """
+    Worker task: price rows start:stop of the shared input columns
+
+    Only the block names, shapes and bounds are pickled; the inputs are read
+    from and the outputs written straight into shared memory, so results
+    land in book order without a merge step.
+    """
+    in_shm, inputs = _attach(in_name, in_shape)
+    out_shm, outputs = _attach(out_name, out_shape)
+    try:
+        result = func(*inputs[:, start:stop], **kwargs)
+        if isinstance(result, tuple):
+            for k, col in enumerate(result):
+                outputs[k, start:stop] = col
+        else:
+            outputs[0, start:stop] = result
+    finally:
+        del inputs, outputs
+        in_shm.close()
+        out_shm.close()
+    return stop - start
+
+
+def make_pool(workers=None):
+    """
+    Start a reusable worker pool for shard_map and the *_parallel functions
+
+    The shared-memory resource tracker is started first so that forked
+    workers share it with this process instead of each starting their own
+    (which would warn about, and try to unlink, blocks they never owned).
+    """
+    resource_tracker.ensure_running()
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+
+def shard_map(func, columns, n_outputs=1, workers=None, chunk_size=None, pool=None, **kwargs):
+    """
+    Price a book across worker processes through shared memory
+
+    columns is a sequence of equal-length 1-D arrays (scalars are broadcast)
+    passed positionally to func, which must be a module-level function that
+    returns one array or a tuple of n_outputs arrays. The book is copied once
+    into a shared (columns x contracts) block and split into chunks; each
+    worker writes its slice of a shared (n_outputs x contracts) result block.
+
+    pool may be an existing pool from make_pool() to avoid paying process
+    start-up on every call. Returns an array, or a tuple of n_outputs arrays.
+    """
+    cols = np.broadcast_arrays(*[np.ravel(np.asarray(c, dtype=float)) for c in columns])
+    n = cols[0].size
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # a few chunks per worker so a slow chunk does not hold up the rest
+        chunk_size = max(1, -(-n // (4*workers)))
+
+    in_shm = shared_memory.SharedMemory(create=True, size=max(1, len(cols)*n*8))
+    out_shm = shared_memory.SharedMemory(create=True, size=max(1, n_outputs*n*8))
+    try:
+        in_shape, out_shape = (len(cols), n), (n_outputs, n)
+        inputs = np.ndarray(in_shape, dtype=float, buffer=in_shm.buf)
+        for k, col in enumerate(cols):
+            inputs[k] = col
+        outputs = np.ndarray(out_shape, dtype=float, buffer=out_shm.buf)
+
+        executor = pool or make_pool(workers)
+        try:
+            futures = [executor.submit(_run_shard, func, in_shm.name, in_shape, out_shm.name,
+                                       out_shape, start, min(start + chunk_size, n), kwargs)
+                       for start in range(0, n, chunk_size)]
+            for f in futures:
+                f.result()
+        finally:
+            if pool is None:
+                executor.shutdown()
+
+        result = tuple(outputs[k].copy() for k in range(n_outputs))
+        del inputs, outputs
+    finally:
+        in_shm.close()
+        in_shm.unlink()
+        out_shm.close()
+        out_shm.unlink()
+    return result if n_outputs > 1 else result[0]
+
+
+def black_scholes_parallel(S, K, T, r, sigma, q=0.0, workers=None, pool=None):
+    """Batch Black-Scholes (dividend yield q) over worker processes; returns (call_price, put_price)"""
+    return shard_map(black_scholes, (S, K, T, r, sigma, q), n_outputs=2, workers=workers, pool=pool)
+
+
+def binomial_price_parallel(S0, K, r, sigma, T, n, q=0.0, option='put', american=True,
+                            futures=False, workers=None, pool=None):
+    """Batch CRR tree pricing (see binomial_price_batch) over worker processes"""
+    return shard_map(_binomial_kernel, (S0, K, r, sigma, T, q), workers=workers, pool=pool,
+                     n=n, option=option, american=american, futures=futures)
+
+
+def _binomial_kernel(S0, K, r, sigma, T, q, n, option, american, futures):
+    """Positional-column adapter for binomial_price_batch"""
+    return binomial_price_batch(S0, K, r, sigma, T, n, q=q, option=option,
+                                american=american, futures=futures)
@@ -0,0 +1,155 @@
+import math
+import os
+import re
+
+import numpy as np
+
+# Headless charts on matplotlib's Agg canvas. Figures are built with
+# matplotlib.figure.Figure rather than pyplot, so nothing opens a window,
+# nothing is kept in pyplot's global figure list, and savefig picks the
+# format (png, svg, pdf, ...) from the file extension.
+
+
+def new_figure(figsize=(10, 6), dpi=100):
+    """A Figure attached to an Agg canvas, outside pyplot"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def draw_tree(ax, S, V, value_label='P', max_labels=200, view=None):
+    """
+    Draw a recombining binomial tree on ax
+
+    S and V are the per-step node arrays from binomial.lattice_nodes;
+    node (i, j) sits at (i, i - 2j). All edges are one LineCollection and
+    all nodes one scatter (plus one for the 2n + 1 nodes on the outer
+    edges), whatever the number of steps. Nodes are labelled with their
+    price and value; when they would crowd each other or exceed
+    max_labels, only every k-th step and every k-th node of it are.
+    view = (x0, x1, y0, y1) zooms the axes to that window and draws and
+    labels only the nodes inside it.
+
+    Returns the number of labelled nodes.
+    """
+    from matplotlib.collections import LineCollection
+
+    n = len(S) - 1
+    i = np.concatenate([np.full(k + 1, k) for k in range(n + 1)])
+    j = np.concatenate([np.arange(k + 1) for k in range(n + 1)])
+    x, y = i.astype(float), (i - 2*j).astype(float)
+    s, v = np.concatenate(S), np.concatenate(V)
+
+    # the up moves from every node with j downs lie on one straight line,
+    # as do the down moves from every node with i - j ups, so the n(n+1)
+    # edges are drawn as 2n long segments
+    m = np.arange(n, dtype=float)
+    up = np.stack([np.column_stack([m, -m]), np.column_stack([np.full(n, n), n - 2*m])], axis=1)
+    down = np.stack([np.column_stack([m, m]), np.column_stack([np.full(n, n), 2*m - n])], axis=1)
+    ax.add_collection(LineCollection(np.concatenate([up, down]), colors='k', alpha=0.2, linewidths=1.0))
+
+    if view is None:
+        shown = np.ones(x.size, dtype=bool)
+        ax.set_xlim(-0.5, n + 0.5)
+        ax.set_ylim(-(n + 2), n + 2)  # room for the labels above and below
+    else:
+        # nodes outside the view are left out, which keeps vector output small
+        vx0, vx1, vy0, vy1 = view
+        shown = (x >= vx0) & (x <= vx1) & (y >= vy0) & (y <= vy1)
+        ax.set_xlim(vx0 - 0.5, vx1 + 0.5)
+        ax.set_ylim(vy0 - 1.5, vy1 + 1.5)
+
+    # every node in one single-colour scatter (Agg's fast marker path), then
+    # the top edge green and the bottom edge red over it
+    size = max(300*min(1.0, (5.0/(n + 1))**2), 1.0)
+    style = dict(s=size, edgecolors='black', linewidths=0.8 if size > 20 else 0.2, zorder=2)
+    ax.scatter(x[shown], y[shown], c='lightyellow', **style)
+    edge = shown & ((j == 0) | (j == i))
+    ax.scatter(x[edge], y[edge], c=np.where(j[edge] == 0, 'lightgreen', 'lightcoral'), **style)
+
+    # labels are thinned to every k-th step and every k-th node of it, k
+    # large enough to stay within max_labels and to keep labels about
+    # 60 x 40 pixels apart at the axes' size
+    box = ax.get_window_extent()
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    stride = max(1, math.ceil(60*(x1 - x0)/box.width), math.ceil(20*(y1 - y0)/box.height))
+    while True:
+        label = shown & (i % stride == 0) & (j % stride == 0)
+        if label.sum() <= max_labels:
+            break
+        stride += 1
+    for xk, yk, sk, vk in zip(x[label].tolist(), y[label].tolist(), s[label].tolist(), v[label].tolist()):
+        # stock price above, option value below
+        ax.annotate(f'S={sk:.0f}', (xk, yk), xytext=(0, 7), textcoords='offset points', ha='center',
+                    fontweight='bold', fontsize=9)
+        ax.annotate(f'{value_label}={vk:.1f}', (xk, yk), xytext=(0, -7), textcoords='offset points',
+                    ha='center', va='top', fontsize=8)
+    return int(label.sum())
+
+
+def render_tree(S, V, path, title='Option Tree', value_label='P', max_labels=200, view=None,
+                figsize=(10, 6), dpi=100):
+    """Draw a tree (see draw_tree) straight to an image file; returns path"""
+    fig = new_figure(figsize, dpi)
+    ax = fig.add_subplot()
+    draw_tree(ax, S, V, value_label, max_labels, view)
+    ax.set_title(title)
+    ax.set_xlabel('Time Step')
+    ax.grid(alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path)
+    return path
+
+
+def render_payoff_charts(book, S_T, directory, cost=None, fmt='png', figsize=(8, 5), dpi=100):
+    """
+    One profit-at-expiry chart per strategy of a StrategyBook, as files
+
+    The profits and exact breakevens of every strategy come from one
+    book.profit/book.analyze call. A single figure is drawn once and
+    then only its data is swapped per strategy (profit line, strike and
+    breakeven markers, title, limits) before each save, so the cost per
+    chart is essentially the image encoding. Files are named after the
+    strategies, with anything but letters, digits, '.', '-' and '_'
+    replaced by '_'.
+
+    Returns the list of file paths, in book order.
+    """
+    from matplotlib.collections import LineCollection
+
+    os.makedirs(directory, exist_ok=True)
+    S_T = np.asarray(S_T, dtype=float)
+    profits = book.profit(S_T, cost)
+    breakevens = book.analyze(cost)['breakevens']
+
+    fig = new_figure(figsize, dpi)
+    ax = fig.add_subplot()
+    line, = ax.plot(S_T, profits[0], color='tab:green', linewidth=2)
+    ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    strikes = ax.add_collection(LineCollection([], colors='gray', linestyles=':', alpha=0.6))
+    marks = ax.scatter([], [], color='orange', zorder=3)
+    ax.set_xlabel('Stock Price ($)')
+    ax.set_ylabel('Profit ($)')
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(S_T.min(), S_T.max())
+    title = ax.set_title('', fontweight='bold')
+    fig.tight_layout()
+
+    paths = []
+    for k, name in enumerate(book.names):
+        lo, hi = profits[k].min(), profits[k].max()
+        pad = 0.05*(hi - lo) or 1.0
+        ax.set_ylim(lo - pad, hi + pad)
+        line.set_ydata(profits[k])
+        K = np.unique(book.K[book.strategy == k])
+        strikes.set_segments([[(x, lo - pad), (x, hi + pad)] for x in K.tolist()])
+        be = breakevens[k]
+        marks.set_offsets(np.column_stack([be, np.zeros_like(be)]))
+        title.set_text(f'{name}: profit at expiry')
+        path = os.path.join(directory, re.sub(r'[^\w.-]+', '_', str(name)) + '.' + fmt)
+        fig.savefig(path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,133 @@
+import numpy as np
+
+from bonds import cashflow_matrix
+
+MODES = ('taylor', 'full', 'hybrid')
+
+
+class BondScenarioEngine:
+    """
+    Scenario x bond P&L for a bond book under yield-curve shifts
+
+    The book is priced once at its yields (compounded as in bond_analytics)
+    and its discounted cashflows are bucketed by payment date into a sparse
+    (dates x bonds) matrix W. A scenario is a shift of the continuously
+    compounded zero curve given on a grid of tenors, linear in between and
+    flat beyond the ends (one tenor gives a parallel shift); each cashflow
+    at t is repriced by exp(-shift(t)*t). Every mode is then one matrix
+    product:
+
+    - 'full': exact, expm1(-X) @ W with X the (scenarios x dates) matrix
+      of shift(t)*t
+    - 'taylor': second order, from key-rate durations (tenors x bonds) and
+      key-rate convexities cached at construction; for a parallel shift
+      this is P*(-D*dy + C*dy^2/2) with Macaulay duration D and convexity C
+    - 'hybrid': Taylor, except that cells whose remainder bound exceeds
+      tol are repriced exactly (only the scenarios and bonds involved)
+
+    quantity scales each bond's column (positions); P&L is in price units.
+    """
+
+    def __init__(self, coupon, maturity, ytm, tenors=(0.0,), frequency=1, face=100.0,
+                 compounding='continuous', quantity=1.0):
+        t, cf, freq = cashflow_matrix(coupon, maturity, frequency, face)
+        n = t.shape[0]
+        y = np.broadcast_to(np.ravel(np.asarray(ytm, dtype=float)), (n,))[:, None]
+        if compounding == 'continuous':
+            pv = cf*np.exp(-y*t)
+        elif compounding == 'periodic':
+            pv = cf*np.exp(-freq*t*np.log1p(y/freq))
+        else:
+            raise ValueError(f"compounding must be 'continuous' or 'periodic', got {compounding!r}")
+        pv *= np.broadcast_to(np.ravel(np.asarray(quantity, dtype=float)), (n,))[:, None]
+        live = cf != 0
+
+        from scipy import sparse
+
+        # (dates x bonds) discounted cashflows, summed over equal dates
+        self.dates, inverse = np.unique(t[live], return_inverse=True)
+        bond = np.broadcast_to(np.arange(n)[:, None], t.shape)[live]
+        self.W = sparse.csr_array((pv[live], (inverse.ravel(), bond)), shape=(self.dates.size, n))
+        self.value = pv.sum(axis=1)
+
+        # tent weights of each date on the tenor grid (np.interp's weights)
+        self.tenors = np.atleast_1d(np.asarray(tenors, dtype=float))
+        m = self.tenors.size
+        self._phi = np.stack([np.interp(self.dates, self.tenors, np.eye(m)[j]) for j in range(m)], axis=1)
+        tW = sparse.csr_array(self.W.multiply(self.dates[:, None]))
+        t2W = sparse.csr_array(tW.multiply(self.dates[:, None]))
+        # key-rate duration and convexity: sum pv*t*phi_j and sum pv*t^2*phi_j*phi_l
+        # (tents only overlap their neighbours, so convexity is tridiagonal)
+        self.krd = np.asarray((tW.T @ self._phi).T)
+        self._conv_diag = np.asarray((t2W.T @ self._phi**2).T)
+        self._conv_off = np.asarray((t2W.T @ (self._phi[:, :-1]*self._phi[:, 1:])).T)
+        # for the remainder bound: sum pv*t^3 and the last payment date per bond
+        self._m3 = np.asarray(sparse.csr_array(t2W.multiply(self.dates[:, None])).sum(axis=0)).ravel()
+        self._t_max = t.max(axis=1)
+
+    def _shifts(self, shifts):
+        """(scenarios x tenors) shift matrix; a 1-D array is one value per scenario for one tenor"""
+        a = np.asarray(shifts, dtype=float)
+        if a.ndim == 1 and self.tenors.size == 1:
+            a = a[:, None]
+        if a.ndim != 2 or a.shape[1] != self.tenors.size:
+            raise ValueError(f"shifts must have shape (scenarios, {self.tenors.size})")
+        return a
+
+    def taylor(self, shifts):
+        """Second-order P&L from cached key-rate durations and convexities"""
+        a = self._shifts(shifts)
+        pnl = -(a @ self.krd)
+        pnl += 0.5*((a*a) @ self._conv_diag)
+        if a.shape[1] > 1:
+            pnl += (a[:, :-1]*a[:, 1:]) @ self._conv_off
+        return pnl
+
+    def full(self, shifts, bonds=None):
+        """Exact P&L by repricing every cashflow (optionally for a subset of bonds)"""
+        W, phi, dates = self.W, self._phi, self.dates
+        if bonds is not None:
+            # only the payment dates of those bonds need an exp
+            W = W[:, bonds]
+            used = np.flatnonzero(np.diff(W.indptr))
+            W, phi, dates = W[used], phi[used], dates[used]
+        X = (self._shifts(shifts) @ phi.T)*dates
+        return np.asarray(np.expm1(-X) @ W)
+
+    def error_bound(self, shifts):
+        """
+        Bound on |full - taylor| per scenario and bond
+
+        The third-order remainder of exp(-x) is at most |x|^3/6*e^|x|, and
+        |shift(t)| never exceeds the largest tenor shift m, so the bound is
+        m^3/6 * e^(m*T) * sum(|pv|*t^3), with T the bond's last payment date.
+        """
+        m = np.abs(self._shifts(shifts)).max(axis=1)[:, None]
+        return m**3/6*np.exp(m*self._t_max)*np.abs(self._m3)
+
+    def pnl(self, shifts, mode='full', tol=1e-6):
+        """
+        Scenario x bond P&L matrix
+
+        shifts is (scenarios x tenors), or one value per scenario when
+        the engine has a single tenor. mode is 'full', 'taylor' or
+        'hybrid'; tol is the hybrid mode's largest accepted Taylor error
+        bound, in price units.
+        """
+        if mode == 'full':
+            return self.full(shifts)
+        if mode == 'taylor':
+            return self.taylor(shifts)
+        if mode != 'hybrid':
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        a = self._shifts(shifts)
+        pnl = self.taylor(a)
+        bad = self.error_bound(a) > tol
+        rows, cols = np.flatnonzero(bad.any(axis=1)), np.flatnonzero(bad.any(axis=0))
+        if rows.size:
+            exact = self.full(a[rows], cols)
+            block = bad[np.ix_(rows, cols)]
+            sub = pnl[np.ix_(rows, cols)]
+            sub[block] = exact[block]
+            pnl[np.ix_(rows, cols)] = sub
+        return pnl
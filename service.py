@@ -0,0 +1,235 @@
+import argparse
+import asyncio
+import json
+import math
+import time
+
+import numpy as np
+
+from binomial import binomial_price_batch
+from black_scholes import black_scholes
+
+# Pricing service: newline-delimited JSON requests over a local TCP or Unix socket
+# Usage: python service.py [--host 127.0.0.1] [--port 8765 | --unix PATH] [--window-us 200]
+#
+# Request:  {"id": 1, "method": "black_scholes", "params": {"S": 30, "K": 29, "T": 0.33, "r": 0.05, "sigma": 0.25}}
+# Response: {"id": 1, "result": {"call": 2.52, "put": 1.05}}  or  {"id": 1, "error": "..."}
+#
+# Replies are strict JSON: non-finite numbers (NaN, Infinity, 1e999) are
+# rejected in requests, and a result that is not finite (e.g. from sigma=0
+# at the strike) is sent as null.
+METHODS = ('black_scholes', 'parity', 'binomial', 'stats')
+
+# method -> (required params, optional params with defaults)
+_PARAMS = {
+    'black_scholes': (('S', 'K', 'T', 'r', 'sigma'), {'q': 0.0}),
+    'parity': (('S', 'K', 'T', 'r'), {'q': 0.0, 'call': math.nan, 'put': math.nan}),
+    'binomial': (('S', 'K', 'T', 'r', 'sigma'), {'q': 0.0, 'n': 100, 'option': 'put',
+                                                 'american': True, 'futures': False}),
+}
+# binomial params that are scalars for a whole vectorized call, so they split batches
+_BATCH_KEYS = ('n', 'option', 'american', 'futures')
+
+
+def _black_scholes(cols, opts):
+    call, put = black_scholes(cols['S'], cols['K'], cols['T'], cols['r'], cols['sigma'], cols['q'])
+    return {'call': call, 'put': put}
+
+
+def _parity(cols, opts):
+    """The missing side of C - P = S e^(-qT) - K e^(-rT), given whichever of call/put was sent"""
+    forward_gap = cols['S']*np.exp(-cols['q']*cols['T']) - cols['K']*np.exp(-cols['r']*cols['T'])
+    call = np.where(np.isnan(cols['call']), cols['put'] + forward_gap, cols['call'])
+    put = np.where(np.isnan(cols['put']), cols['call'] - forward_gap, cols['put'])
+    return {'call': call, 'put': put}
+
+
+def _binomial(cols, opts):
+    price = binomial_price_batch(cols['S'], cols['K'], cols['r'], cols['sigma'], cols['T'], opts['n'],
+                                 q=cols['q'], option=opts['option'], american=opts['american'],
+                                 futures=opts['futures'])
+    return {'price': price}
+
+
+_KERNELS = {'black_scholes': _black_scholes, 'parity': _parity, 'binomial': _binomial}
+
+
+def _finite_number(text):
+    """json.loads hook for NaN, Infinity and non-integer numbers: only finite floats pass"""
+    value = float(text)
+    if not math.isfinite(value):
+        raise ValueError(f"{text} is not a finite number")
+    return value
+
+
+def _finite_or_none(result):
+    """A result dict with non-finite floats replaced by None, for strict JSON"""
+    return {k: None if isinstance(v, float) and not math.isfinite(v) else v for k, v in result.items()}
+
+
+class PricingService:
+    """
+    Micro-batching front end to the vectorized pricers
+
+    Requests for the same method (and, for binomial, the same steps,
+    option type and exercise style) that arrive within `window` seconds
+    of the first one are priced together in one vectorized call; a batch
+    is also flushed as soon as it reaches max_batch requests. window=0
+    still batches whatever arrived in the same event-loop iteration, and
+    max_batch=1 turns batching off.
+
+    Latency is measured per request from arrival to result, and the last
+    `history` of them are kept for the p50/p99 in stats().
+    """
+
+    def __init__(self, window=200e-6, max_batch=4096, history=100000):
+        self.window = window
+        self.max_batch = max_batch
+        self._pending = {}
+        self._latency = np.zeros(history)
+        self._tasks = set()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start a new measurement interval"""
+        self.requests = 0
+        self.batches = 0
+        self._started = time.perf_counter()
+
+    def stats(self):
+        """Requests, batches, throughput (requests/s) and p50/p99 latency (microseconds)"""
+        n = min(self.requests, self._latency.size)
+        p50, p99 = np.percentile(self._latency[:n], [50, 99])*1e6 if n else (math.nan, math.nan)
+        elapsed = time.perf_counter() - self._started
+        return {'requests': self.requests, 'batches': self.batches,
+                'mean_batch': self.requests/self.batches if self.batches else 0.0,
+                'throughput': self.requests/elapsed if elapsed > 0 else 0.0,
+                'p50_us': float(p50), 'p99_us': float(p99)}
+
+    async def price(self, method, params, arrived=None):
+        """Queue one request and wait for its batch; returns a dict of floats (NaN where not finite)"""
+        if method not in _KERNELS:
+            raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+        required, optional = _PARAMS[method]
+        missing = [k for k in required if k not in params]
+        if missing:
+            raise ValueError(f"{method} is missing {missing}")
+        unknown = set(params) - set(required) - set(optional)
+        if unknown:
+            raise ValueError(f"{method} got unknown params {sorted(unknown)}")
+        values = {**optional, **params}
+        for k in values:
+            if k not in _BATCH_KEYS:
+                values[k] = float(values[k])
+        if method == 'parity' and math.isnan(values['call']) and math.isnan(values['put']):
+            raise ValueError("parity needs a call or a put price")
+        if method == 'binomial':
+            values['n'] = int(values['n'])
+            values['american'] = bool(values['american'])
+            values['futures'] = bool(values['futures'])
+        key = (method,) + (tuple(values[k] for k in _BATCH_KEYS) if method == 'binomial' else ())
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.window, self._flush, key, batch)
+        batch.append((values, future, time.perf_counter() if arrived is None else arrived))
+        if len(batch) >= self.max_batch:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key, batch):
+        """Price one batch with a single vectorized call and resolve its futures"""
+        if self._pending.get(key) is not batch:
+            return  # already flushed when it filled up
+        del self._pending[key]
+        method = key[0]
+        required, optional = _PARAMS[method]
+        try:
+            cols = {k: np.array([v[k] for v, _, _ in batch])
+                    for k in required + tuple(k for k in optional if k not in _BATCH_KEYS)}
+            out = _KERNELS[method](cols, batch[0][0])
+            rows = [dict(zip(out, vals)) for vals in zip(*(np.broadcast_to(a, (len(batch),)).tolist()
+                                                          for a in out.values()))]
+        except Exception as exc:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        now = time.perf_counter()
+        size = self._latency.size
+        for i, (row, (_, future, arrived)) in enumerate(zip(rows, batch)):
+            self._latency[(self.requests + i) % size] = now - arrived
+            if not future.done():
+                future.set_result(row)
+        self.requests += len(batch)
+        self.batches += 1
+
+    async def _respond(self, line, writer):
+        arrived = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line, parse_float=_finite_number, parse_constant=_finite_number)
+            request_id = request.get('id')
+            method = request.get('method')
+            if method == 'stats':
+                result = self.stats()
+                if request.get('params', {}).get('reset'):
+                    self.reset_stats()
+            else:
+                result = await self.price(method, request.get('params', {}), arrived)
+            reply = json.dumps({'id': request_id, 'result': _finite_or_none(result)}, allow_nan=False)
+        except Exception as exc:
+            reply = json.dumps({'id': request_id, 'error': f"{type(exc).__name__}: {exc}"}, allow_nan=False)
+        writer.write(reply.encode() + b'\n')
+
+    async def handle(self, reader, writer):
+        """One client connection; pipelined requests are answered as their batches complete"""
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(line, writer))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                if writer.transport.get_write_buffer_size() > 2**20:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def warm_up(self):
+        """Price one dummy contract per method, so lazy imports are not paid by the first client"""
+        cols = {k: np.ones(1) for k in ('S', 'K', 'T', 'r', 'sigma', 'q', 'call')}
+        cols['put'] = np.full(1, np.nan)
+        for kernel in _KERNELS.values():
+            kernel(cols, _PARAMS['binomial'][1])
+
+    async def serve(self, host='127.0.0.1', port=8765, path=None):
+        """Listen on a Unix socket at path, or on host:port, until cancelled"""
+        self.warm_up()
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle, path)
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-batching option pricing service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--window-us', type=float, default=200.0, help="batching window in microseconds")
+    parser.add_argument('--max-batch', type=int, default=4096)
+    args = parser.parse_args()
+
+    service = PricingService(window=args.window_us*1e-6, max_batch=args.max_batch)
+    print(f"pricing service on {args.unix or f'{args.host}:{args.port}'}, "
+          f"window {args.window_us:g} us, max batch {args.max_batch}", flush=True)
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
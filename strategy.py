@@ -0,0 +1,174 @@
+import numpy as np
+
+from black_scholes import black_scholes
+
+
+def _unique_rows(*cols):
+    """
+    Distinct rows of equal-length 1-D key columns
+
+    Returns (unique, inverse) like np.unique(..., axis=0), but sorts with
+    lexsort on the numeric columns, which is many times faster than the
+    byte-wise row sort np.unique uses.
+    """
+    order = np.lexsort(cols[::-1])
+    new = np.ones(order.size, dtype=bool)
+    new[1:] = np.any([np.diff(c[order]) != 0 for c in cols], axis=0)
+    inverse = np.empty(order.size, dtype=int)
+    inverse[order] = np.cumsum(new) - 1
+    first = order[new]
+    return [c[first] for c in cols], inverse
+
+
+class StrategyBook:
+    """
+    Any number of multi-leg option strategies evaluated together
+
+    strategies maps a name to a list of legs (option, K, T, quantity) or
+    (option, K, T, quantity, premium), in the format monte_carlo_strategies
+    takes: option is 'call' or 'put' and quantity is negative for short
+    legs. The legs are kept as flat arrays, and every distinct contract is
+    stored once with a (strategies x contracts) weight matrix, so payoff,
+    P&L and cost for the whole book are each one matrix product over legs
+    that are evaluated only once however many strategies share them.
+    """
+
+    def __init__(self, strategies):
+        names, index, legs = [], [], []
+        for k, (name, strategy) in enumerate(strategies.items()):
+            names.append(name)
+            for leg in strategy:
+                index.append(k)
+                legs.append(leg)
+        option = np.array([leg[0] for leg in legs])
+        K, T, qty = (np.array([leg[k] for leg in legs], dtype=float) for k in (1, 2, 3))
+        premium = np.array([leg[4] if len(leg) > 4 else np.nan for leg in legs])
+        self._build(names, np.array(index, dtype=int), option, K, T, qty, premium)
+
+    @classmethod
+    def from_arrays(cls, strategy, option, K, T, quantity, premium=None, names=None):
+        """
+        Build a book straight from leg arrays
+
+        strategy[i] is the (0-based) strategy that leg i belongs to; option
+        may be an array of 'call'/'put' or of booleans (True for calls), and
+        scalars are broadcast across the legs.
+        Skips the per-leg Python loop, for scanning large candidate sets.
+        """
+        strategy = np.asarray(strategy, dtype=int)
+        option = np.asarray(option)
+        if option.dtype == bool:
+            option = np.where(option, 'call', 'put')
+        premium = np.nan if premium is None else premium
+        K, T, quantity, premium = (np.broadcast_to(np.asarray(a, dtype=float), strategy.shape)
+                                   for a in (K, T, quantity, premium))
+        n = strategy.max() + 1 if strategy.size else 0
+        names = list(range(n)) if names is None else list(names)
+        book = cls.__new__(cls)
+        book._build(names, strategy, np.broadcast_to(option, strategy.shape), K, T, quantity, premium)
+        return book
+
+    def _build(self, names, index, option, K, T, qty, premium):
+        bad = ~np.isin(option, ('call', 'put'))
+        if bad.any():
+            raise ValueError(f"option must be 'call' or 'put', got {option[bad][0]!r}")
+        self.names = names
+        self.is_call = option == 'call'
+        self.K, self.T, self.quantity, self.premium = K, T, qty, premium
+        self.strategy = index
+
+        # distinct contracts (type, K, T) for pricing, and (type, K) for
+        # the payoff at expiry, each with its strategy weight matrix
+        n = len(names)
+        self._contracts, inverse = _unique_rows(self.is_call.astype(float), K, T)
+        m = inverse.max() + 1 if inverse.size else 0
+        self._W = np.bincount(index*m + inverse, qty, minlength=n*m).reshape(n, m)
+        self._strikes, inverse = _unique_rows(*self._contracts[:2])
+        merge = np.zeros((m, len(self._strikes[0])))
+        merge[np.arange(m), inverse] = 1.0
+        self._payoff_W = self._W @ merge
+
+    def __len__(self):
+        return len(self.names)
+
+    def payoff(self, S_T):
+        """
+        Payoff at expiry over a grid of terminal prices
+
+        Returns an array of shape (strategies, grid). Every leg is settled
+        at the grid price, so a strategy mixing expiries is treated as if
+        all of its legs expired together.
+        """
+        S_T = np.asarray(S_T, dtype=float)
+        is_call, K = self._strikes
+        # one row per distinct (type, strike): theta*(S - K) floored at 0
+        theta = np.where(is_call > 0, 1.0, -1.0)[:, None]
+        legs = np.maximum(theta*(S_T.ravel() - K[:, None]), 0.0)
+        return (self._payoff_W @ legs).reshape((len(self),) + S_T.shape)
+
+    def cost(self, S=None, r=None, sigma=None, q=0.0):
+        """
+        Upfront cost of each strategy (negative for a net credit)
+
+        With S, r and sigma, each distinct contract is priced once with
+        Black-Scholes; otherwise the premiums given with the legs are used.
+        sigma may also be a VolSurface (anything with vol(K, T)), giving
+        each contract its own volatility.
+        """
+        if S is None:
+            if np.isnan(self.premium).any():
+                raise ValueError("every leg needs a premium when S, r and sigma are not given")
+            return np.bincount(self.strategy, self.quantity*self.premium, minlength=len(self))
+        is_call, K, T = self._contracts
+        if hasattr(sigma, 'vol'):
+            sigma = sigma.vol(K, T)
+        call, put = black_scholes(S, K, T, r, sigma, q)
+        return self._W @ np.where(is_call > 0, call, put)
+
+    def profit(self, S_T, cost=None):
+        """P&L at expiry, payoff minus cost (default: the leg premiums)"""
+        cost = self.cost() if cost is None else np.asarray(cost, dtype=float)
+        payoff = self.payoff(S_T)
+        return payoff - cost.reshape((-1,) + (1,)*(payoff.ndim - 1))
+
+    def analyze(self, cost=None):
+        """
+        Exact breakevens, maximum profit and maximum loss at expiry
+
+        The P&L is piecewise linear in the terminal price with kinks only
+        at strikes, so it is evaluated at S = 0 and at each distinct strike
+        and extended beyond the highest strike with the net call quantity
+        as its slope; no price grid is involved. cost defaults to the leg
+        premiums.
+
+        Returns a dict with 'breakevens' (a sorted array of prices per
+        strategy), 'max_profit' and 'max_loss' (the loss as a positive
+        amount; inf where unbounded) and 'upside_slope', the P&L per unit
+        rise in price beyond the highest strike (> 0 means unlimited profit,
+        < 0 unlimited loss).
+        """
+        cost = self.cost() if cost is None else np.asarray(cost, dtype=float)
+        x = np.unique(np.concatenate([[0.0], self._strikes[1]]))
+        V = self.payoff(x) - cost.reshape(-1, 1)
+        slope = self._payoff_W @ (self._strikes[0] > 0).astype(float)
+
+        max_profit = np.where(slope > 0, np.inf, V.max(axis=1))
+        max_loss = np.where(slope < 0, np.inf, 0.0 - V.min(axis=1))
+
+        # roots strictly inside a segment, at a node, and beyond the last strike
+        left, right = V[:, :-1], V[:, 1:]
+        cross = left*right < 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inner = x[:-1] - left*np.diff(x)/(right - left)
+            tail = x[-1] - V[:, -1]/slope
+        roots = np.column_stack([np.where(cross, inner, np.nan),
+                                 np.where(V == 0, x, np.nan),
+                                 np.where(V[:, -1]*slope < 0, tail, np.nan)])
+        # sort each row (NaNs last), drop repeats, and split into ragged rows
+        roots.sort(axis=1)
+        roots[:, 1:][roots[:, 1:] == roots[:, :-1]] = np.nan
+        valid = ~np.isnan(roots)
+        flat, ends = roots[valid], np.cumsum(valid.sum(axis=1)).tolist()
+        breakevens = [flat[a:b] for a, b in zip([0] + ends[:-1], ends)]
+        return {'breakevens': breakevens, 'max_profit': max_profit, 'max_loss': max_loss,
+                'upside_slope': slope}
@@ -0,0 +1,201 @@
+import numpy as np
+
+from curve import ArrayCache
+
+SVI_PARAMS = ('a', 'b', 'rho', 'm', 's')
+
+
+def svi_total_variance(k, a, b, rho, m, s):
+    """Raw SVI total implied variance w(k) = a + b*(rho*(k - m) + sqrt((k - m)^2 + s^2))"""
+    x = k - m
+    return a + b*(rho*x + np.sqrt(x*x + s*s))
+
+
+def _svi_inplace(k, a, b, rho, m, s):
+    """svi_total_variance for a float array k and scalar parameters, with two temporaries"""
+    x = k - m
+    w = x*x
+    w += s*s
+    np.sqrt(w, out=w)
+    x *= rho
+    w += x
+    w *= b
+    w += a
+    return w
+
+
+def svi_fit(k, w, weights=None, x0=None):
+    """
+    Least-squares raw SVI fit of total variances w at log-moneyness k
+
+    The fit runs on (v, b, rho, m, s) with v = a + b*s*sqrt(1 - rho^2)
+    the smile's minimum total variance, so simple bounds (v >= 0, b >= 0,
+    |rho| < 1, s > 0) keep the variance non-negative everywhere. x0 is
+    a previous raw parameter set to start from (a refit of a slice whose
+    quotes moved a little); otherwise the start is read off the quotes.
+
+    Returns the raw parameters as an array (a, b, rho, m, s).
+    """
+    from scipy.optimize import least_squares
+
+    k = np.asarray(k, dtype=float)
+    w = np.asarray(w, dtype=float)
+    sw = np.ones_like(w) if weights is None else np.sqrt(np.asarray(weights, dtype=float))
+    if x0 is None:
+        i = np.argmin(w)
+        m = k[i]
+        left = (w[0] - w[i])/(m - k[0]) if k[0] < m else 0.0
+        right = (w[-1] - w[i])/(k[-1] - m) if k[-1] > m else 0.0
+        b = max((left + right)/2, 1e-3)
+        rho = np.clip((right - left)/(right + left), -0.9, 0.9) if right + left > 0 else 0.0
+        start = np.array([w[i], b, rho, m, 0.1])
+    else:
+        a, b, rho, m, s = x0
+        start = np.array([a + b*s*np.sqrt(1 - rho*rho), b, rho, m, s])
+    lower = [0.0, 0.0, -0.999, -np.inf, 1e-4]
+    upper = [np.inf, np.inf, 0.999, np.inf, np.inf]
+    start = np.clip(start, np.add(lower, 1e-12), np.subtract(upper, 1e-12))
+
+    def residuals(x):
+        v, b, rho, m, s = x
+        return sw*(svi_total_variance(k, v - b*s*np.sqrt(1 - rho*rho), b, rho, m, s) - w)
+
+    v, b, rho, m, s = least_squares(residuals, start, bounds=(lower, upper), x_scale='jac').x
+    return np.array([v - b*s*np.sqrt(1 - rho*rho), b, rho, m, s])
+
+
+class VolSurface:
+    """
+    Implied volatility surface from per-expiry SVI smiles
+
+    T, K and vol are columns of implied-vol quotes (one row per quote;
+    weights optional), on an underlying at spot S with rate r and yield
+    q. Each expiry's quotes are fitted with a raw SVI smile in
+    log-moneyness k = ln(K/F), F the forward, and the fitted parameters
+    are kept as one (5 x expiries) array. Between expiries total variance
+    w = vol^2*T is interpolated linearly in T at fixed k; before the first
+    and after the last expiry the nearest smile's implied vols are held.
+    No calendar or butterfly arbitrage checks are made.
+
+    vol() caches its result per distinct (K, T) grid in self.cache, an
+    ArrayCache of up to cache_bytes (0 disables it); update_slice()
+    refits a single expiry and clears it.
+    """
+
+    def __init__(self, S, r, T, K, vol, q=0.0, weights=None, cache_bytes=2**26):
+        self.S, self.r, self.q = float(S), float(r), float(q)
+        T, K, vol = (np.ravel(a) for a in np.broadcast_arrays(*(np.asarray(a, dtype=float)
+                                                                for a in (T, K, vol))))
+        if T.size == 0:
+            raise ValueError("a surface needs at least one quote")
+        weights = np.ones_like(vol) if weights is None else np.broadcast_to(np.ravel(weights), vol.shape)
+        self.times = np.empty(0)
+        self.params = np.empty((len(SVI_PARAMS), 0))
+        self.rmse = np.empty(0)
+        self.cache = ArrayCache(cache_bytes)
+        for t in np.unique(T).tolist():
+            at = T == t
+            self.update_slice(t, K[at], vol[at], weights[at])
+
+    def log_moneyness(self, K, T):
+        """ln(K/F) with F = S*e^((r - q)T)"""
+        return np.log(np.asarray(K, dtype=float)/self.S) - (self.r - self.q)*np.asarray(T, dtype=float)
+
+    def update_slice(self, T, K, vol, weights=None):
+        """
+        Refit one expiry from its new quotes (adding it if new)
+
+        An existing expiry is refitted starting from its current
+        parameters; every other slice is left as it is.
+        """
+        T = float(T)
+        if T <= 0:
+            raise ValueError("expiries must be positive")
+        K, vol = np.broadcast_arrays(np.ravel(np.asarray(K, dtype=float)), np.ravel(np.asarray(vol, dtype=float)))
+        order = np.argsort(K)
+        K, vol = K[order], vol[order]
+        weights = None if weights is None else np.broadcast_to(np.ravel(weights), K.shape)[order]
+        k = self.log_moneyness(K, T)
+        w = vol*vol*T
+        j = int(np.searchsorted(self.times, T))
+        existing = j < self.times.size and self.times[j] == T
+        params = svi_fit(k, w, weights, self.params[:, j] if existing else None)
+        rmse = float(np.sqrt(np.mean((np.sqrt(svi_total_variance(k, *params)/T) - vol)**2)))
+        if existing:
+            self.params[:, j] = params
+            self.rmse[j] = rmse
+        else:
+            self.times = np.insert(self.times, j, T)
+            self.params = np.insert(self.params, j, params, axis=1)
+            self.rmse = np.insert(self.rmse, j, rmse)
+        self.cache.clear()
+
+    def _interpolate(self, K, T, as_vol):
+        """
+        Total variance (or implied vol) at broadcast K, T
+
+        Contracts are grouped by the pair of expiries they fall between
+        (a stable counting sort, skipped when T is already in expiry
+        order), so each group evaluates two SVI smiles with scalar
+        parameters instead of gathering parameters per contract.
+        """
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        shape = T.shape
+        k = self.log_moneyness(K, T).ravel()
+        t = T.ravel()
+        times, n = self.times, self.times.size
+        # j = number of expiries before each T, so group j lies between expiries j - 1 and j
+        if n <= 32:
+            j = np.zeros(t.size, dtype=np.int16)
+            for s in times.tolist():
+                j += t > s
+        else:
+            j = np.searchsorted(times, t)
+        grouped = bool(np.all(j[1:] >= j[:-1]))
+        if not grouped:
+            order = np.argsort(j, kind='stable')
+            k, t = k[order], t[order]
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(j, minlength=n + 1))]).tolist()
+        out = np.empty(k.size)
+        for i in range(n + 1):
+            a, b = bounds[i], bounds[i + 1]
+            if a == b:
+                continue
+            kk, tt = k[a:b], t[a:b]
+            if i == 0 or i == n:
+                # outside the quoted expiries: the nearest smile's vols
+                e = 0 if i == 0 else n - 1
+                w = _svi_inplace(kk, *self.params[:, e].tolist())
+                if as_vol:
+                    w /= times[e]
+                    np.sqrt(w, out=out[a:b])
+                else:
+                    np.multiply(w, tt/times[e], out=out[a:b])
+                continue
+            w = _svi_inplace(kk, *self.params[:, i - 1].tolist())
+            dw = _svi_inplace(kk, *self.params[:, i].tolist())
+            dw -= w
+            dw *= (tt - times[i - 1])/(times[i] - times[i - 1])
+            w += dw
+            if as_vol:
+                w /= tt
+                np.sqrt(w, out=w)
+            out[a:b] = w
+        if not grouped:
+            out, sorted_out = np.empty_like(out), out
+            out[order] = sorted_out
+        return out.reshape(shape)
+
+    def total_variance(self, K, T):
+        """Total implied variance vol^2*T at strikes K and expiries T (broadcast, T > 0)"""
+        return self._interpolate(K, T, as_vol=False)
+
+    def vol(self, K, T):
+        """
+        Implied volatilities at strikes K and expiries T (broadcast)
+
+        Array results come from self.cache and are read-only; copy them
+        before modifying.
+        """
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        return self.cache.get(lambda: self._interpolate(K, T, as_vol=True), K, T)